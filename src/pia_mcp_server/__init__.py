@@ -2,13 +2,22 @@
 PIA MCP Server initialization
 """
 
-from . import server
 import asyncio
 
 
 def main():
     """Main entry point for the package."""
-    asyncio.run(server.main())
+    # Imported here so that importing a submodule such as
+    # pia_mcp_server.config does not load the whole MCP server stack
+    from . import server
+
+    try:
+        # uvloop is not available on Windows; fall back to the default loop
+        import uvloop
+    except ImportError:
+        asyncio.run(server.main())
+    else:
+        uvloop.run(server.main())
 
 
 __all__ = ["main", "server"]
@@ -1,6 +1,7 @@
 """Configuration settings for the PIA MCP server."""
 
 import sys
+from pydantic import PrivateAttr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 import logging
 import os
@@ -13,56 +14,79 @@ class Settings(BaseSettings):
 
     APP_NAME: str = "pia-mcp-server"
     APP_VERSION: str = "0.1.0"
+    # Largest page_size or limit forwarded to the PIA API; bigger values are capped
     MAX_RESULTS: int = 50
     BATCH_SIZE: int = 20
     REQUEST_TIMEOUT: int = 60
 
+    # Connection pool for the shared PIA API client
+    MAX_CONNECTIONS: int = 100
+    MAX_KEEPALIVE_CONNECTIONS: int = 20
+    KEEPALIVE_EXPIRY: float = 30.0
+    HTTP2: bool = True
+    # Requests to the PIA API allowed in flight at once; the rest wait
+    MAX_CONCURRENT_REQUESTS: int = 20
+
+    # Response cache for successful tool calls (a TTL of 0 disables caching)
+    CACHE_TTL: float = 300.0
+    FACETS_CACHE_TTL: float = 3600.0
+    # How long expired facets are still served while a refresh runs
+    FACETS_STALE_TTL: float = 600.0
+    CACHE_MAX_SIZE: int = 512
+    # Total length of cached responses, in characters (about 64 MB of ASCII JSON)
+    CACHE_MAX_CHARS: int = 64_000_000
+    # SQLite file that keeps cached responses across restarts (unset disables it)
+    CACHE_PATH: str | None = None
+    # Most responses kept in that file; expired and surplus rows are pruned
+    CACHE_PATH_MAX_ROWS: int = 10_000
+
+    # Fetch page N+1 in the background after a successful call for page N
+    PREFETCH_NEXT_PAGE: bool = False
+
+    # Return results as compact JSON instead of indented, using fewer tokens
+    COMPACT_RESPONSES: bool = False
+
     # PIA Server Configuration
     PIA_API_URL: str = "https://mcp.programintegrity.org/"
 
     model_config = SettingsConfigDict(extra="allow")
 
+    # Resolved API key, cached after the first successful lookup
+    _api_key: str | None = PrivateAttr(default=None)
+
     def _get_api_key_from_args(self) -> str | None:
         """Extract API key from command line arguments.
 
         Returns:
             str | None: The API key if specified in arguments, None otherwise.
         """
-        args = sys.argv[1:]
-
-        # If not enough arguments
-        if len(args) < 2:
-            return None
-
-        # Look for the --api-key option
-        try:
-            api_key_index = args.index("--api-key")
-        except ValueError:
-            return None
-
-        # Early return if --api-key is the last argument
-        if api_key_index + 1 >= len(args):
-            return None
+        args = iter(sys.argv[1:])
 
-        try:
-            return args[api_key_index + 1]
-        except (TypeError, ValueError) as e:
-            logger.warning(f"Invalid API key format: {e}")
+        # Single pass: return the value following the --api-key option, or
+        # None if the option is missing or is the last argument
+        for arg in args:
+            if arg == "--api-key":
+                return next(args, None)
 
         return None
 
     @property
     def API_KEY(self) -> str:
-        """Get the API key"""
+        """Get the API key.
+
+        The key is resolved once per settings instance and reused afterwards,
+        since neither the command line nor the environment change at runtime.
+        """
+        if self._api_key is not None:
+            return self._api_key
 
-        logger.info(f"Attempting to retrieve API key. sys.argv: {sys.argv}")
         api_key = self._get_api_key_from_args()
-        logger.info(f"API key from args: {'Found' if api_key else 'Not found'}")
+        logger.debug("API key from args: %s", "Found" if api_key else "Not found")
 
         if not api_key:
             api_key = os.getenv("PIA_API_KEY")
-            logger.info(
-                f"API key from env PIA_API_KEY: {'Found' if api_key else 'Not found'}"
+            logger.debug(
+                "API key from env PIA_API_KEY: %s", "Found" if api_key else "Not found"
             )
 
         if not api_key:
@@ -70,9 +94,10 @@ class Settings(BaseSettings):
             raise ValueError(
                 "PIA API key is required. Please provide --api-key argument or set as PIA_API_KEY environment variable."
             )
-        logger.info(
-            f"API key successfully retrieved: {api_key[:10]}..."
-            if len(api_key) > 10
-            else "API key retrieved"
-        )
+        logger.info("API key retrieved")
+        self._api_key = api_key
         return api_key
+
+
+# Shared settings instance used throughout the server
+settings = Settings()
@@ -1,102 +1,107 @@
 """Prompt handlers for the PIA MCP server."""
 
 import mcp.types as types
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
-# Available prompts for PIA MCP server - EXACT copies from remote server
-AVAILABLE_PROMPTS = [
-    {
-        "name": "summarization_guidance",
-        "description": "Provides guidance on how to summarize information from PIA search results with proper citations",
-        "arguments": [],
-    },
-    {
-        "name": "content_search_guidance",
-        "description": "Provides guidance on how to perform PIA content searches with or without filters",
-        "arguments": [],
-    },
-    {
-        "name": "titles_search_guidance",
-        "description": "Provides guidance on how to search PIA document titles to discover available documents",
-        "arguments": [],
-    },
-    {
-        "name": "recommendations_guidance",
-        "description": "Provides guidance for questions about oversight recommendations data and how to search for recommendation information",
-        "arguments": [],
-    },
-]
 
+@dataclass(frozen=True, slots=True)
+class _ArgSpec:
+    """Definition of a single prompt argument."""
+
+    name: str
+    description: str
+    required: bool = False
 
-async def list_prompts() -> List[types.Prompt]:
-    """List all available prompts."""
-    prompts = []
-
-    for prompt_data in AVAILABLE_PROMPTS:
-        # Convert arguments to proper format
-        arguments = []
-        for arg in prompt_data["arguments"]:
-            arguments.append(
-                types.PromptArgument(
-                    name=arg["name"],
-                    description=arg["description"],
-                    required=arg["required"],
-                )
-            )
 
-        prompt = types.Prompt(
-            name=prompt_data["name"],
-            description=prompt_data["description"],
-            arguments=arguments,
+@dataclass(frozen=True, slots=True)
+class _PromptSpec:
+    """Definition of a prompt exposed by the server."""
+
+    name: str
+    description: str
+    arguments: Tuple[_ArgSpec, ...] = ()
+
+
+# Available prompts for PIA MCP server - EXACT copies from remote server
+AVAILABLE_PROMPTS: Tuple[_PromptSpec, ...] = (
+    _PromptSpec(
+        name="summarization_guidance",
+        description="Provides guidance on how to summarize information from PIA search results with proper citations",
+    ),
+    _PromptSpec(
+        name="content_search_guidance",
+        description="Provides guidance on how to perform PIA content searches with or without filters",
+    ),
+    _PromptSpec(
+        name="titles_search_guidance",
+        description="Provides guidance on how to search PIA document titles to discover available documents",
+    ),
+    _PromptSpec(
+        name="recommendations_guidance",
+        description="Provides guidance for questions about oversight recommendations data and how to search for recommendation information",
+    ),
+)
+
+
+def _build_prompt(spec: _PromptSpec) -> types.Prompt:
+    """Convert a prompt definition into an MCP prompt object."""
+    # Convert arguments to proper format
+    arguments = [
+        types.PromptArgument(
+            name=arg.name,
+            description=arg.description,
+            required=arg.required,
         )
-        prompts.append(prompt)
+        for arg in spec.arguments
+    ]
+
+    return types.Prompt(
+        name=spec.name,
+        description=spec.description,
+        arguments=arguments,
+    )
+
+
+# Prompt definitions are static, so build the MCP objects once at import
+_PROMPTS_CACHE: List[types.Prompt] = [_build_prompt(spec) for spec in AVAILABLE_PROMPTS]
 
-    return prompts
+
+async def list_prompts() -> List[types.Prompt]:
+    """List all available prompts."""
+    return _PROMPTS_CACHE
 
 
 async def get_prompt(
     name: str, arguments: Dict[str, str] | None = None
 ) -> types.GetPromptResult:
-    # Find the prompt
-    prompt_data = None
-    for p in AVAILABLE_PROMPTS:
-        if p["name"] == name:
-            prompt_data = p
-            break
-
-    if not prompt_data:
+    result = _PROMPT_RESULTS.get(name)
+    if result is None:
         raise ValueError(f"Prompt '{name}' not found")
 
-    arguments = arguments or {}
-
-    # Generate prompt content based on the type - EXACT content from remote server
-    if name == "summarization_guidance":
-        content = _generate_summarization_guidance()
-    elif name == "content_search_guidance":
-        content = _generate_content_search_guidance()
-    elif name == "titles_search_guidance":
-        content = _generate_titles_search_guidance()
-    elif name == "recommendations_guidance":
-        content = _generate_recommendations_guidance()
-    else:
-        content = f"Prompt template for {name} - implement specific logic based on arguments: {arguments}"
-
-    return types.GetPromptResult(
-        description=prompt_data["description"],
+    return result
+
+
+def _build_result(spec: _PromptSpec, content: str) -> types.GetPromptResult:
+    """Wrap prompt content in an MCP get-prompt result."""
+    # Role, content type and description are values we control, so skip
+    # pydantic validation when building the result
+    return types.GetPromptResult.model_construct(
+        description=spec.description,
         messages=[
-            types.PromptMessage(
-                role="user", content=types.TextContent(type="text", text=content)
+            types.PromptMessage.model_construct(
+                role="user",
+                content=types.TextContent.model_construct(type="text", text=content),
             )
         ],
     )
 
 
-def _generate_summarization_guidance() -> str:
-    """Generate summarization guidance prompt - EXACT content from remote server."""
-    return """You are an assistant that summarizes information **only** from the provided search results.
+# EXACT content from remote server
+_SUMMARIZATION_GUIDANCE = """You are an assistant that summarizes information **only** from the provided search results.
 
 Your task:
 1. **Only include facts that appear in the provided search results.**
@@ -147,9 +152,8 @@ Remember:
 - If you can't find enough information for a point, omit it entirely."""
 
 
-def _generate_content_search_guidance() -> str:
-    """Generate content search guidance prompt - EXACT content from remote server."""
-    return """You can perform searches using the PIA Search tools with or without filters.
+# EXACT content from remote server
+_CONTENT_SEARCH_GUIDANCE = """You can perform searches using the PIA Search tools with or without filters.
 
 **Search Tool Selection**:
 - Use `pia_search_content` and `pia_search_content_facets` for searching document content and recommendations
@@ -208,9 +212,8 @@ def _generate_content_search_guidance() -> str:
 - Fall back to unfiltered if filtering produces zero results and it hasn't already been run."""
 
 
-def _generate_titles_search_guidance() -> str:
-    """Generate titles search guidance prompt - EXACT content from remote server."""
-    return """You can search document titles using the PIA title search tools to discover what documents are available.
+# EXACT content from remote server
+_TITLES_SEARCH_GUIDANCE = """You can search document titles using the PIA title search tools to discover what documents are available.
 
 **Title Search Tool Selection**:
 - Use `pia_search_titles` to search for document titles only (not content)
@@ -275,9 +278,8 @@ def _generate_titles_search_guidance() -> str:
 - Always validate filter fields/values before applying them"""
 
 
-def _generate_recommendations_guidance() -> str:
-    """Generate recommendations guidance prompt - EXACT content from remote server."""
-    return """You can search and analyze oversight recommendations data using the PIA Search tools.
+# EXACT content from remote server
+_RECOMMENDATIONS_GUIDANCE = """You can search and analyze oversight recommendations data using the PIA Search tools.
 
 **Understanding Recommendations Data**:
 - Recommendations are identified as records where `SourceDocumentDataSet eq 'Open Recommendations'`
@@ -313,3 +315,19 @@ def _generate_recommendations_guidance() -> str:
 4. Consider whether to include/exclude closed recommendations based on the question
 5. Provide links from search results when available
 6. Direct users to additional resources when appropriate"""
+
+
+# Prompt name -> content - EXACT content from remote server
+_PROMPT_CONTENT: Dict[str, str] = {
+    "summarization_guidance": _SUMMARIZATION_GUIDANCE,
+    "content_search_guidance": _CONTENT_SEARCH_GUIDANCE,
+    "titles_search_guidance": _TITLES_SEARCH_GUIDANCE,
+    "recommendations_guidance": _RECOMMENDATIONS_GUIDANCE,
+}
+
+# None of the prompts take arguments, so each result is built once at import
+# and get_prompt is a single dict lookup
+_PROMPT_RESULTS: Dict[str, types.GetPromptResult] = {
+    spec.name: _build_result(spec, _PROMPT_CONTENT[spec.name])
+    for spec in AVAILABLE_PROMPTS
+}
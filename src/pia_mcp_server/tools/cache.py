@@ -0,0 +1,202 @@
+"""Response caches for PIA API tool calls."""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """A size-bounded LRU cache whose entries expire after a per-entry TTL.
+
+    The cache holds at most max_size entries and, if max_chars is set, at
+    most that many characters of values in total; a single result page can
+    be large, so the entry count alone doesn't bound memory. Entries may
+    also be given a grace period after expiry during which get_stale()
+    still returns them, for stale-while-revalidate callers.
+    """
+
+    def __init__(self, max_size: int = 512, max_chars: Optional[int] = None):
+        self.max_size = max_size
+        self.max_chars = max_chars
+        self._chars = 0
+        self._entries: "OrderedDict[str, Tuple[float, float, str]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._lookup(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[2]
+
+    def get_stale(self, key: str) -> Optional[str]:
+        """Return the value for key if it has expired but is within its grace period."""
+        entry = self._lookup(key)
+        if entry is None or entry[0] > time.monotonic():
+            return None
+        return entry[2]
+
+    def set(self, key: str, value: str, ttl: float, stale_ttl: float = 0.0) -> None:
+        """Store value under key for ttl seconds, evicting the oldest entries.
+
+        The value stays available to get_stale() for stale_ttl seconds more.
+        """
+        self._discard(key)
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        if self.max_chars is not None and len(value) > self.max_chars:
+            return
+        expires_at = time.monotonic() + ttl
+        self._entries[key] = (expires_at, expires_at + max(stale_ttl, 0.0), value)
+        self._chars += len(value)
+        while len(self._entries) > self.max_size or (
+            self.max_chars is not None and self._chars > self.max_chars
+        ):
+            self._chars -= len(self._entries.popitem(last=False)[1][2])
+
+    def _lookup(self, key: str) -> Optional[Tuple[float, float, str]]:
+        """Return the live entry for key, dropping it once fully expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            self._discard(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _discard(self, key: str) -> None:
+        """Remove the entry for key, if any."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._chars -= len(entry[2])
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._chars = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PersistentCache:
+    """A read-through response cache kept in a SQLite database on disk.
+
+    Unlike TTLCache it survives server restarts, so queries repeated across
+    sessions are answered locally. The database is opened on first use and
+    any SQLite error disables the cache rather than failing the tool call.
+    Like TTLCache, entries may be kept for a grace period after expiry.
+    Rows past it are deleted when the database is opened and every
+    prune_every writes, which also trim the table to max_rows rows.
+
+    Methods block on disk I/O, so async callers should run them in a
+    thread; a lock keeps those threads from sharing the connection at once.
+    """
+
+    def __init__(
+        self, path: Optional[str], max_rows: int = 10_000, prune_every: int = 100
+    ):
+        self.path = path
+        self.max_rows = max_rows
+        self.prune_every = prune_every
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache has a database to read and write."""
+        return bool(self.path)
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if self._conn is None and self.path:
+            try:
+                # Autocommit: every write is a single statement. WAL with
+                # synchronous=NORMAL avoids an fsync on every commit.
+                conn = sqlite3.connect(
+                    self.path, isolation_level=None, check_same_thread=False
+                )
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=NORMAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS pia_cache(key TEXT PRIMARY KEY, "
+                    "expires REAL, stale_until REAL, body TEXT) WITHOUT ROWID"
+                )
+                conn.execute(
+                    "CREATE INDEX IF NOT EXISTS pia_cache_stale_until "
+                    "ON pia_cache(stale_until)"
+                )
+                self._prune(conn)
+            except sqlite3.Error as e:
+                logger.warning("Persistent cache disabled: %s", e)
+                self.path = None
+                return None
+            self._conn = conn
+        return self._conn
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        """Delete rows past their grace period, then the oldest beyond max_rows."""
+        conn.execute("DELETE FROM pia_cache WHERE stale_until <= ?", (time.time(),))
+        (count,) = conn.execute("SELECT COUNT(*) FROM pia_cache").fetchone()
+        if count > self.max_rows:
+            conn.execute(
+                "DELETE FROM pia_cache WHERE key IN "
+                "(SELECT key FROM pia_cache ORDER BY stale_until LIMIT ?)",
+                (count - self.max_rows,),
+            )
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """Return (value, seconds left) for key, or None if missing or expired.
+
+        An entry within its grace period is still returned, with zero or
+        negative seconds left.
+        """
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            try:
+                row = conn.execute(
+                    "SELECT body, expires, stale_until FROM pia_cache WHERE key = ?",
+                    (key,),
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Persistent cache read failed: %s", e)
+                return None
+        if row is None:
+            return None
+        now = time.time()
+        return (row[0], row[1] - now) if row[2] > now else None
+
+    def set(self, key: str, value: str, ttl: float, stale_ttl: float = 0.0) -> None:
+        """Store value under key for ttl seconds, plus a stale_ttl grace period."""
+        if ttl <= 0 or self.max_rows <= 0:
+            return
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                expires = time.time() + ttl
+                conn.execute(
+                    "INSERT OR REPLACE INTO pia_cache(key, expires, stale_until, body) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, expires, expires + max(stale_ttl, 0.0), value),
+                )
+                self._writes += 1
+                if self._writes % self.prune_every == 0:
+                    self._prune(conn)
+            except sqlite3.Error as e:
+                logger.warning("Persistent cache write failed: %s", e)
+
+    def close(self) -> None:
+        """Close the database connection, if one was opened."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,50 @@
+"""Shared HTTP client for requests to the PIA API."""
+
+import asyncio
+import httpx
+from ..config import settings
+
+_client: httpx.AsyncClient | None = None
+_request_slots: asyncio.Semaphore | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Return the shared HTTP client, creating it on first use.
+
+    Reusing one client keeps connections to the PIA API alive between tool
+    calls instead of paying for a new TCP and TLS handshake on every request.
+    """
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            timeout=settings.REQUEST_TIMEOUT,
+            http2=settings.HTTP2,
+            limits=httpx.Limits(
+                max_connections=settings.MAX_CONNECTIONS,
+                max_keepalive_connections=settings.MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=settings.KEEPALIVE_EXPIRY,
+            ),
+        )
+    return _client
+
+
+def get_request_slots() -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent requests to the PIA API.
+
+    Holding one slot per request caps bursts of tool calls at
+    MAX_CONCURRENT_REQUESTS, so they queue here rather than tripping the
+    API's rate limits.
+    """
+    global _request_slots
+    if _request_slots is None:
+        _request_slots = asyncio.Semaphore(settings.MAX_CONCURRENT_REQUESTS)
+    return _request_slots
+
+
+async def close_client() -> None:
+    """Close the shared HTTP client, if one was created, and its request slots."""
+    global _client, _request_slots
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+    _request_slots = None
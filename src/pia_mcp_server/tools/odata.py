@@ -0,0 +1,194 @@
+"""Canonical forms of OData filter expressions, used for response caching."""
+
+from typing import List, Tuple, Union
+
+# A parsed filter: an atom's text, or (operator, operands) for and/or/not
+_Node = Union[str, Tuple[str, List["_Node"]]]
+
+
+class _ParseError(Exception):
+    """Raised when a filter cannot be parsed into a boolean expression."""
+
+
+def _tokenize(expr: str) -> List[str]:
+    """Split a filter into words, quoted strings, parentheses and whitespace."""
+    tokens: List[str] = []
+    i, n = 0, len(expr)
+    while i < n:
+        char = expr[i]
+        if char.isspace():
+            j = i
+            while j < n and expr[j].isspace():
+                j += 1
+            tokens.append(" ")
+        elif char == "'":
+            # OData escapes a quote inside a string by doubling it
+            j = i + 1
+            while j < n:
+                if expr[j] == "'":
+                    if j + 1 < n and expr[j + 1] == "'":
+                        j += 2
+                        continue
+                    break
+                j += 1
+            if j >= n:
+                raise _ParseError("unterminated string literal")
+            j += 1
+            tokens.append(expr[i:j])
+        elif char in "()":
+            j = i + 1
+            tokens.append(char)
+        else:
+            j = i
+            while j < n and not expr[j].isspace() and expr[j] not in "()'":
+                j += 1
+            tokens.append(expr[i:j])
+        i = j
+    return tokens
+
+
+class _Parser:
+    """Recursive-descent parser for the and/or/not structure of a filter.
+
+    Comparisons and function calls are kept as opaque atoms; only the
+    boolean operators between them are interpreted.
+    """
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        self.pos = 0
+
+    def _skip_space(self) -> None:
+        while self.pos < len(self.tokens) and self.tokens[self.pos] == " ":
+            self.pos += 1
+
+    def _peek(self) -> str | None:
+        self._skip_space()
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def parse(self) -> _Node:
+        node = self._parse_binary("or")
+        if self._peek() is not None:
+            raise _ParseError("unexpected trailing input")
+        return node
+
+    def _parse_binary(self, op: str) -> _Node:
+        parse_operand = self._parse_unary if op == "and" else self._parse_and
+        operands = [parse_operand()]
+        while self._peek() == op:
+            self.pos += 1
+            operands.append(parse_operand())
+        return operands[0] if len(operands) == 1 else (op, operands)
+
+    def _parse_and(self) -> _Node:
+        return self._parse_binary("and")
+
+    def _parse_unary(self) -> _Node:
+        token = self._peek()
+        if token == "not" and self._peek_after_not() == "(":
+            self.pos += 1
+            return ("not", [self._parse_unary()])
+        if token == "(":
+            self.pos += 1
+            node = self._parse_binary("or")
+            if self._peek() != ")":
+                raise _ParseError("unbalanced parentheses")
+            self.pos += 1
+            return node
+        return self._parse_atom()
+
+    def _peek_after_not(self) -> str | None:
+        """Return the token after the "not" at the current position.
+
+        "not" binds tighter than comparisons, so only "not (...)" negates a
+        whole expression; "not A eq 1" means "(not A) eq 1" and is kept as
+        one opaque atom.
+        """
+        pos = self.pos + 1
+        while pos < len(self.tokens) and self.tokens[pos] == " ":
+            pos += 1
+        return self.tokens[pos] if pos < len(self.tokens) else None
+
+    def _parse_atom(self) -> str:
+        parts: List[str] = []
+        depth = 0
+        while self.pos < len(self.tokens):
+            token = self.tokens[self.pos]
+            if depth == 0 and (token in ("and", "or", ")")):
+                break
+            if token == "(":
+                depth += 1
+            elif token == ")":
+                depth -= 1
+            parts.append(token)
+            self.pos += 1
+        if depth != 0:
+            raise _ParseError("unbalanced parentheses")
+        atom = "".join(parts).strip()
+        if not atom:
+            raise _ParseError("missing operand")
+        return atom
+
+
+def _render(node: _Node) -> str:
+    """Render a node with sorted and/or operands and minimal parentheses."""
+    if isinstance(node, str):
+        return node
+    op, operands = node
+    if op == "not":
+        (operand,) = operands
+        text = _render(operand)
+        if isinstance(operand, str) and _is_primary(operand):
+            return f"not {text}"
+        return f"not ({text})"
+
+    parts = []
+    for operand in _flatten(op, operands):
+        text = _render(operand)
+        # "and" binds tighter than "or", so only nested "or" needs grouping
+        if isinstance(operand, tuple) and operand[0] == "or":
+            text = f"({text})"
+        parts.append(text)
+    return f" {op} ".join(sorted(parts))
+
+
+def _is_primary(atom: str) -> bool:
+    """Whether an atom is a single token or function call, safe after "not"."""
+    tokens = _tokenize(atom)
+    if len(tokens) == 1:
+        return True
+    if len(tokens) < 3 or tokens[1] != "(" or tokens[-1] != ")":
+        return False
+    depth = 0
+    for i, token in enumerate(tokens[1:], start=1):
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            if depth == 0:
+                return i == len(tokens) - 1
+    return False
+
+
+def _flatten(op: str, operands: List[_Node]) -> List[_Node]:
+    """Merge nested operands using the same operator, e.g. (a and b) and c."""
+    flat: List[_Node] = []
+    for operand in operands:
+        if isinstance(operand, tuple) and operand[0] == op:
+            flat.extend(_flatten(op, operand[1]))
+        else:
+            flat.append(operand)
+    return flat
+
+
+def canonicalize_filter(expr: str) -> str:
+    """Return a canonical form of an OData filter expression.
+
+    Equivalent filters that differ only in whitespace, redundant
+    parentheses or the order of and/or operands map to the same string.
+    Filters that cannot be parsed are returned unchanged.
+    """
+    try:
+        return _render(_Parser(_tokenize(expr)).parse())
+    except _ParseError:
+        return expr
@@ -1,48 +1,196 @@
 """PIA Search tools for database searches and facets discovery."""
 
+import asyncio
+import functools
 import httpx
+import jsonschema
 import mcp.types as types
-from typing import Dict, Any, List
-import json
+from typing import Awaitable, Callable, Dict, Any, List, Tuple
 import logging
-from ..config import Settings
+import orjson
+from ..config import settings
+from .cache import PersistentCache, TTLCache
+from .http_client import get_client, get_request_slots
+from .odata import canonicalize_filter
 
 logger = logging.getLogger(__name__)
-settings = Settings()
+
+# Requests currently awaiting a response from the PIA API, keyed by
+# _request_key(), so identical concurrent tool calls share one POST.
+_inflight: Dict[str, "asyncio.Future[List[types.TextContent]]"] = {}
+
+# Running next-page prefetches, referenced here so they aren't collected
+_prefetches: "set[asyncio.Future[List[types.TextContent]]]" = set()
+
+# Static parts of every JSON-RPC request sent to the PIA API, pre-encoded so
+# only the tool name and arguments are serialized per call.
+_ENVELOPE_PREFIX = b'{"jsonrpc":"2.0","id":1,"method":"tools/call","params":{"name":'
+_ENVELOPE_ARGUMENTS = b',"arguments":'
+_ENVELOPE_SUFFIX = b"}}"
+
+# Upstream error bodies longer than this are cut short in error messages.
+_MAX_ERROR_BODY_CHARS = 2000
+
+# Pause before retrying a request whose connection failed or was dropped.
+_RETRY_DELAY = 0.1
+
+# Formatted results of successful tool calls, keyed by _request_key().
+_response_cache = TTLCache(
+    max_size=settings.CACHE_MAX_SIZE, max_chars=settings.CACHE_MAX_CHARS
+)
+# The same results kept on disk when CACHE_PATH is set, checked on a miss.
+_persistent_cache = PersistentCache(
+    settings.CACHE_PATH, max_rows=settings.CACHE_PATH_MAX_ROWS
+)
+
+# Facet counts change far less often than search results.
+_FACETS_TOOLS = frozenset({"pia_search_content_facets", "pia_search_titles_facets"})
+
+__all__ = [
+    "handle_pia_search_content",
+    "pia_search_content_tool",
+    "handle_pia_search_content_facets",
+    "pia_search_content_facets_tool",
+    "handle_pia_search_titles",
+    "pia_search_titles_tool",
+    "handle_pia_search_titles_facets",
+    "pia_search_titles_facets_tool",
+    "handle_pia_search_content_gao",
+    "pia_search_content_gao_tool",
+    "handle_pia_search_content_oig",
+    "pia_search_content_oig_tool",
+    "handle_pia_search_content_crs",
+    "pia_search_content_crs_tool",
+    "handle_pia_search_content_doj",
+    "pia_search_content_doj_tool",
+    "handle_pia_search_content_congress",
+    "pia_search_content_congress_tool",
+    "handle_pia_search_content_executive_orders",
+    "pia_search_content_executive_orders_tool",
+    "handle_search",
+    "search_tool",
+    "handle_fetch",
+    "fetch_tool",
+    "handle_pia_batch",
+    "pia_batch_tool",
+    "TOOLS",
+    "TOOL_HANDLERS",
+    "validate_input",
+    "close_caches",
+]
+
+# OData filter help shared by the search tools' "filter" parameter
+_ODATA_FILTER_FIELDS = (
+    "• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n"
+    "• SourceDocumentOrg: Organization associated with the document. There are many values, use pia_search_content_facets tool to see available options\n"
+    "• SourceDocumentTitle: Document title - use contains, eq for text matching\n"
+    "• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n"
+    "• RecStatus: Recommendation status\n"
+    "• RecPriorityFlag: Priority flag for recommendations\n"
+    "• IsIntegrityRelated: Whether the content is integrity-related\n"
+    "• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n"
+    "• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n"
+    "• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n"
+    "• RecRecommendation: Recommendation text - use contains, eq for text matching\n"
+    "• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n"
+    "\n"
+    "OPERATORS:\n"
+    "• Text: contains, eq, ne, startswith, endswith\n"
+    "• Exact: eq (equals), ne (not equals), in (in list)\n"
+    "• Date: ge (greater/equal), le (less/equal), eq (equals)\n"
+    "• Logic: and, or, not, parentheses for grouping\n"
+)
+
+
+def _odata_filter_description(data_source: str, examples: Tuple[str, ...]) -> str:
+    """Build a filter parameter description around the shared field list."""
+    return (
+        "Optional OData filter expression supporting complex boolean logic.\n\n"
+        "AVAILABLE FIELDS:\n"
+        f"• {data_source} Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n"
+        + _ODATA_FILTER_FIELDS
+        + "\nEXAMPLES:\n"
+        + "".join(f'• "{example}"\n' for example in examples)
+        + "\nTIP: Use pia_search_content_facets tool to get the most current available values."
+    )
+
+
+def _source_filter_description(data_source: str) -> str:
+    """Build the filter description for a tool scoped to one data source."""
+    return _odata_filter_description(
+        f"Note: SourceDocumentDataSource is automatically set to '{data_source}' for this tool.",
+        _SOURCE_ODATA_EXAMPLES,
+    )
+
+
+_ODATA_FILTER_DESCRIPTION = _odata_filter_description(
+    "SourceDocumentDataSource: Data source/agency that published the document.",
+    (
+        "SourceDocumentDataSource eq 'GAO'",
+        "SourceDocumentDataSource eq 'GAO' and RecStatus ne 'Closed'",
+        "IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'",
+        "(SourceDocumentDataSource eq 'GAO' or SourceDocumentDataSource eq 'OIG') and RecStatus eq 'Open'",
+        "SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'",
+    ),
+)
+
+_SOURCE_ODATA_EXAMPLES = (
+    "RecStatus eq 'Open'",
+    "RecStatus ne 'Closed' and RecPriorityFlag eq 'Yes'",
+    "IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'",
+    "(RecStatus eq 'Open' and RecPriorityFlag eq 'Yes')",
+    "SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'",
+)
+
+
+# Input schema properties shared by several tools
+_QUERY_PROPERTY = {"type": "string", "description": "Search query text"}
+_FACETS_QUERY_PROPERTY = {
+    "type": "string",
+    "description": "Optional query to get facets for",
+    "default": "",
+}
+_PAGE_PROPERTY = {
+    "type": "integer",
+    "description": "Page number (default: 1)",
+    "default": 1,
+    "minimum": 1,
+}
+_PAGE_SIZE_PROPERTY = {
+    "type": "integer",
+    "description": "Results per page (default: 10)",
+    "default": 10,
+}
+_SEARCH_MODE_PROPERTY = {
+    "type": "string",
+    "description": "Search mode (default: content)",
+    "default": "content",
+}
+_LIMIT_PROPERTY = {"type": "integer", "description": "Maximum results limit"}
+_INCLUDE_FACETS_PROPERTY = {
+    "type": "boolean",
+    "description": "Include facets in results",
+    "default": False,
+}
 
 # Tool definitions - EXACT copies from remote server
-pia_search_content_tool = types.Tool(
+# Built with model_construct() since these constant schemas need no validation
+pia_search_content_tool = types.Tool.model_construct(
     name="pia_search_content",
     description="Search the Program Integrity Alliance (PIA) database for document content and recommendations. Returns comprehensive results with full citation information and clickable links for proper attribution. Each result includes corresponding citations with data source attribution. Major data sources include: Department of Justice (198k+ docs), Congress.gov (29k+ docs), Oversight.gov (22k+ docs), CRS (22k+ docs), GAO (10k+ docs), Federal Register (1k+ executive orders). Use pia_search_content_executive_orders to search only executive orders. Supports complex OData filtering with boolean logic, operators, and grouping.",
     inputSchema={
         "type": "object",
         "properties": {
-            "query": {"type": "string", "description": "Search query text"},
+            "query": _QUERY_PROPERTY,
             "filter": {
                 "type": "string",
                 "description": "Optional OData filter expression supporting complex boolean logic.\n\n    AVAILABLE FIELDS:\n    • SourceDocumentDataSource: Data source/agency that published the document. Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n• SourceDocumentTitle: Document title - use contains, eq for text matching\n• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n• RecStatus: Recommendation status\n• RecPriorityFlag: Priority flag for recommendations\n• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n• RecRecommendation: Recommendation text - use contains, eq for text matching\n• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n• referenced_agencies: Agencies referenced by documents (collection field). Example: (referenced_agencies/any(a: a eq 'Department of Defense (DOD)') or referenced_agencies/any(a: a eq 'Department of Justice (DOJ)')) - for single agency omit outer parentheses and 'or'. Get all values via pia_search_content_facets. Note: Many data sources such as CRS and Congress do not tag documents with agency. In these cases PIA infers agencies through AI tagging and in some cases the agency may be incorrect. This tagging only tags documents where the agency is explicitly mentioned.\n\n    OPERATORS:\n    • Text: contains, eq, ne, startswith, endswith\n    • Exact: eq (equals), ne (not equals), in (in list)\n    • Date: ge (greater/equal), le (less/equal), eq (equals)\n    • Logic: and, or, not, parentheses for grouping\n\n    EXAMPLES:\n    • \"SourceDocumentDataSource eq 'GAO'\"\n    • \"SourceDocumentDataSource eq 'GAO' and RecStatus ne 'Closed'\"\n    • \"(SourceDocumentDataSource eq 'GAO' or SourceDocumentDataSource eq 'OIG') and RecStatus eq 'Open'\"\n    • \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n\n    TIP: Use pia_search_content_facets tool to get the most current available values.",
             },
-            "page": {
-                "type": "integer",
-                "description": "Page number (default: 1)",
-                "default": 1,
-            },
-            "page_size": {
-                "type": "integer",
-                "description": "Results per page (default: 10)",
-                "default": 10,
-            },
-            "search_mode": {
-                "type": "string",
-                "description": "Search mode (default: content)",
-                "default": "content",
-            },
-            "limit": {"type": "integer", "description": "Maximum results limit"},
-            "include_facets": {
-                "type": "boolean",
-                "description": "Include facets in results",
-                "default": False,
-            },
+            "page": _PAGE_PROPERTY,
+            "page_size": _PAGE_SIZE_PROPERTY,
+            "search_mode": _SEARCH_MODE_PROPERTY,
+            "limit": _LIMIT_PROPERTY,
+            "include_facets": _INCLUDE_FACETS_PROPERTY,
         },
         "required": ["query"],
     },
@@ -106,26 +254,22 @@ pia_search_content_tool = types.Tool(
     },
 )
 
-pia_search_content_facets_tool = types.Tool(
+pia_search_content_facets_tool = types.Tool.model_construct(
     name="pia_search_content_facets",
     description="Get available facets (filter values) for the PIA database content search. This can help understand what filter values are available before performing content searches. Major data sources include: Department of Justice (198k+ docs), Congress.gov (29k+ docs), Oversight.gov (22k+ docs), CRS (22k+ docs), GAO (10k+ docs), Federal Register (1k+ executive orders). Use pia_search_content_executive_orders to search only executive orders.",
     inputSchema={
         "type": "object",
         "properties": {
-            "query": {
-                "type": "string",
-                "description": "Optional query to get facets for",
-                "default": "",
-            },
+            "query": _FACETS_QUERY_PROPERTY,
             "filter": {
                 "type": "string",
-                "description": "Optional OData filter expression supporting complex boolean logic.\n\nAVAILABLE FIELDS:\n• SourceDocumentDataSource: Data source/agency that published the document. Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n• SourceDocumentOrg: Organization associated with the document. There are many values, use pia_search_content_facets tool to see available options\n• SourceDocumentTitle: Document title - use contains, eq for text matching\n• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n• RecStatus: Recommendation status\n• RecPriorityFlag: Priority flag for recommendations\n• IsIntegrityRelated: Whether the content is integrity-related\n• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n• RecRecommendation: Recommendation text - use contains, eq for text matching\n• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n\nOPERATORS:\n• Text: contains, eq, ne, startswith, endswith\n• Exact: eq (equals), ne (not equals), in (in list)\n• Date: ge (greater/equal), le (less/equal), eq (equals)\n• Logic: and, or, not, parentheses for grouping\n\nEXAMPLES:\n• \"SourceDocumentDataSource eq 'GAO'\"\n• \"SourceDocumentDataSource eq 'GAO' and RecStatus ne 'Closed'\"\n• \"IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'\"\n• \"(SourceDocumentDataSource eq 'GAO' or SourceDocumentDataSource eq 'OIG') and RecStatus eq 'Open'\"\n• \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n\nTIP: Use pia_search_content_facets tool to get the most current available values.",
+                "description": _ODATA_FILTER_DESCRIPTION,
             },
         },
     },
 )
 
-pia_search_titles_tool = types.Tool(
+pia_search_titles_tool = types.Tool.model_construct(
     name="pia_search_titles",
     description="Search the Program Integrity Alliance (PIA) database for document titles only. Returns document titles and metadata without searching the full content. Useful for finding specific documents by title or discovering available documents. Major data sources include: Department of Justice (198k+ docs), Congress.gov (29k+ docs), Oversight.gov (22k+ docs), CRS (22k+ docs), GAO (10k+ docs), Federal Register (1k+ executive orders). Use pia_search_content_executive_orders to search only executive orders.",
     inputSchema={
@@ -137,272 +281,126 @@ pia_search_titles_tool = types.Tool(
             },
             "filter": {
                 "type": "string",
-                "description": "Optional OData filter expression supporting complex boolean logic.\n\nAVAILABLE FIELDS:\n• SourceDocumentDataSource: Data source/agency that published the document. Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n• SourceDocumentOrg: Organization associated with the document. There are many values, use pia_search_content_facets tool to see available options\n• SourceDocumentTitle: Document title - use contains, eq for text matching\n• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n• RecStatus: Recommendation status\n• RecPriorityFlag: Priority flag for recommendations\n• IsIntegrityRelated: Whether the content is integrity-related\n• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n• RecRecommendation: Recommendation text - use contains, eq for text matching\n• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n\nOPERATORS:\n• Text: contains, eq, ne, startswith, endswith\n• Exact: eq (equals), ne (not equals), in (in list)\n• Date: ge (greater/equal), le (less/equal), eq (equals)\n• Logic: and, or, not, parentheses for grouping\n\nEXAMPLES:\n• \"SourceDocumentDataSource eq 'GAO'\"\n• \"SourceDocumentDataSource eq 'GAO' and RecStatus ne 'Closed'\"\n• \"IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'\"\n• \"(SourceDocumentDataSource eq 'GAO' or SourceDocumentDataSource eq 'OIG') and RecStatus eq 'Open'\"\n• \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n\nTIP: Use pia_search_content_facets tool to get the most current available values.",
-            },
-            "page": {
-                "type": "integer",
-                "description": "Page number (default: 1)",
-                "default": 1,
-            },
-            "page_size": {
-                "type": "integer",
-                "description": "Results per page (default: 10)",
-                "default": 10,
-            },
-            "limit": {"type": "integer", "description": "Maximum results limit"},
-            "include_facets": {
-                "type": "boolean",
-                "description": "Include facets in results",
-                "default": False,
+                "description": _ODATA_FILTER_DESCRIPTION,
             },
+            "page": _PAGE_PROPERTY,
+            "page_size": _PAGE_SIZE_PROPERTY,
+            "limit": _LIMIT_PROPERTY,
+            "include_facets": _INCLUDE_FACETS_PROPERTY,
         },
         "required": ["query"],
     },
 )
 
-pia_search_titles_facets_tool = types.Tool(
+pia_search_titles_facets_tool = types.Tool.model_construct(
     name="pia_search_titles_facets",
     description="Get available facets (filter values) for the PIA database title search. This can help understand what filter values are available before performing title searches. Major data sources include: Department of Justice (198k+ docs), Congress.gov (29k+ docs), Oversight.gov (22k+ docs), CRS (22k+ docs), GAO (10k+ docs), Federal Register (1k+ executive orders). Use pia_search_content_executive_orders to search only executive orders.",
     inputSchema={
         "type": "object",
         "properties": {
-            "query": {
-                "type": "string",
-                "description": "Optional query to get facets for",
-                "default": "",
-            },
+            "query": _FACETS_QUERY_PROPERTY,
             "filter": {
                 "type": "string",
-                "description": "Optional OData filter expression supporting complex boolean logic.\n\nAVAILABLE FIELDS:\n• SourceDocumentDataSource: Data source/agency that published the document. Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n• SourceDocumentOrg: Organization associated with the document. There are many values, use pia_search_content_facets tool to see available options\n• SourceDocumentTitle: Document title - use contains, eq for text matching\n• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n• RecStatus: Recommendation status\n• RecPriorityFlag: Priority flag for recommendations\n• IsIntegrityRelated: Whether the content is integrity-related\n• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n• RecRecommendation: Recommendation text - use contains, eq for text matching\n• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n\nOPERATORS:\n• Text: contains, eq, ne, startswith, endswith\n• Exact: eq (equals), ne (not equals), in (in list)\n• Date: ge (greater/equal), le (less/equal), eq (equals)\n• Logic: and, or, not, parentheses for grouping\n\nEXAMPLES:\n• \"SourceDocumentDataSource eq 'GAO'\"\n• \"SourceDocumentDataSource eq 'GAO' and RecStatus ne 'Closed'\"\n• \"IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'\"\n• \"(SourceDocumentDataSource eq 'GAO' or SourceDocumentDataSource eq 'OIG') and RecStatus eq 'Open'\"\n• \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n\nTIP: Use pia_search_content_facets tool to get the most current available values.",
+                "description": _ODATA_FILTER_DESCRIPTION,
             },
         },
     },
 )
 
+
 # NEW TOOLS from remote server
-pia_search_content_gao_tool = types.Tool(
-    name="pia_search_content_gao",
-    description="Search the Program Integrity Alliance (PIA) database for GAO document content and recommendations. This tool automatically filters results to only include documents from the Government Accountability Office (GAO). Returns comprehensive results with full citation information and clickable links for proper attribution. Each result includes corresponding citations with data source attribution. Supports complex OData filtering with boolean logic, operators, and grouping.",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "query": {"type": "string", "description": "Search query text"},
-            "filter": {
-                "type": "string",
-                "description": "Optional OData filter expression supporting complex boolean logic.\n\nAVAILABLE FIELDS:\n• Note: SourceDocumentDataSource is automatically set to 'GAO' for this tool. Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n• SourceDocumentOrg: Organization associated with the document. There are many values, use pia_search_content_facets tool to see available options\n• SourceDocumentTitle: Document title - use contains, eq for text matching\n• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n• RecStatus: Recommendation status\n• RecPriorityFlag: Priority flag for recommendations\n• IsIntegrityRelated: Whether the content is integrity-related\n• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n• RecRecommendation: Recommendation text - use contains, eq for text matching\n• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n\nOPERATORS:\n• Text: contains, eq, ne, startswith, endswith\n• Exact: eq (equals), ne (not equals), in (in list)\n• Date: ge (greater/equal), le (less/equal), eq (equals)\n• Logic: and, or, not, parentheses for grouping\n\nEXAMPLES:\n• \"RecStatus eq 'Open'\"\n• \"RecStatus ne 'Closed' and RecPriorityFlag eq 'Yes'\"\n• \"IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'\"\n• \"(RecStatus eq 'Open' and RecPriorityFlag eq 'Yes')\"\n• \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n\nTIP: Use pia_search_content_facets tool to get the most current available values.",
-            },
-            "page": {
-                "type": "integer",
-                "description": "Page number (default: 1)",
-                "default": 1,
-            },
-            "page_size": {
-                "type": "integer",
-                "description": "Results per page (default: 10)",
-                "default": 10,
-            },
-            "search_mode": {
-                "type": "string",
-                "description": "Search mode (default: content)",
-                "default": "content",
-            },
-            "limit": {"type": "integer", "description": "Maximum results limit"},
-            "include_facets": {
-                "type": "boolean",
-                "description": "Include facets in results",
-                "default": False,
+def _make_source_tool(
+    name: str, label: str, origin: str, data_source: str
+) -> types.Tool:
+    """Build a content search tool restricted to a single data source."""
+    return types.Tool.model_construct(
+        name=name,
+        description=f"Search the Program Integrity Alliance (PIA) database for {label} document content and recommendations. This tool automatically filters results to only include documents from {origin}. Returns comprehensive results with full citation information and clickable links for proper attribution. Each result includes corresponding citations with data source attribution. Supports complex OData filtering with boolean logic, operators, and grouping.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": _QUERY_PROPERTY,
+                "filter": {
+                    "type": "string",
+                    "description": _source_filter_description(data_source),
+                },
+                "page": _PAGE_PROPERTY,
+                "page_size": _PAGE_SIZE_PROPERTY,
+                "search_mode": _SEARCH_MODE_PROPERTY,
+                "limit": _LIMIT_PROPERTY,
+                "include_facets": _INCLUDE_FACETS_PROPERTY,
             },
+            "required": ["query"],
         },
-        "required": ["query"],
-    },
+    )
+
+
+pia_search_content_gao_tool = _make_source_tool(
+    "pia_search_content_gao",
+    "GAO",
+    "the Government Accountability Office (GAO)",
+    "GAO",
 )
 
-pia_search_content_oig_tool = types.Tool(
-    name="pia_search_content_oig",
-    description="Search the Program Integrity Alliance (PIA) database for OIG document content and recommendations. This tool automatically filters results to only include documents from Office of Inspector General (OIG) sources. Returns comprehensive results with full citation information and clickable links for proper attribution. Each result includes corresponding citations with data source attribution. Supports complex OData filtering with boolean logic, operators, and grouping.",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "query": {"type": "string", "description": "Search query text"},
-            "filter": {
-                "type": "string",
-                "description": "Optional OData filter expression supporting complex boolean logic.\n\nAVAILABLE FIELDS:\n• Note: SourceDocumentDataSource is automatically set to 'Oversight.gov' for this tool. Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n• SourceDocumentOrg: Organization associated with the document. There are many values, use pia_search_content_facets tool to see available options\n• SourceDocumentTitle: Document title - use contains, eq for text matching\n• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n• RecStatus: Recommendation status\n• RecPriorityFlag: Priority flag for recommendations\n• IsIntegrityRelated: Whether the content is integrity-related\n• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n• RecRecommendation: Recommendation text - use contains, eq for text matching\n• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n\nOPERATORS:\n• Text: contains, eq, ne, startswith, endswith\n• Exact: eq (equals), ne (not equals), in (in list)\n• Date: ge (greater/equal), le (less/equal), eq (equals)\n• Logic: and, or, not, parentheses for grouping\n\nEXAMPLES:\n• \"RecStatus eq 'Open'\"\n• \"RecStatus ne 'Closed' and RecPriorityFlag eq 'Yes'\"\n• \"IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'\"\n• \"(RecStatus eq 'Open' and RecPriorityFlag eq 'Yes')\"\n• \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n\nTIP: Use pia_search_content_facets tool to get the most current available values.",
-            },
-            "page": {
-                "type": "integer",
-                "description": "Page number (default: 1)",
-                "default": 1,
-            },
-            "page_size": {
-                "type": "integer",
-                "description": "Results per page (default: 10)",
-                "default": 10,
-            },
-            "search_mode": {
-                "type": "string",
-                "description": "Search mode (default: content)",
-                "default": "content",
-            },
-            "limit": {"type": "integer", "description": "Maximum results limit"},
-            "include_facets": {
-                "type": "boolean",
-                "description": "Include facets in results",
-                "default": False,
-            },
-        },
-        "required": ["query"],
-    },
+pia_search_content_oig_tool = _make_source_tool(
+    "pia_search_content_oig",
+    "OIG",
+    "Office of Inspector General (OIG) sources",
+    "Oversight.gov",
 )
 
-pia_search_content_crs_tool = types.Tool(
-    name="pia_search_content_crs",
-    description="Search the Program Integrity Alliance (PIA) database for CRS document content and recommendations. This tool automatically filters results to only include documents from Congressional Research Service (CRS). Returns comprehensive results with full citation information and clickable links for proper attribution. Each result includes corresponding citations with data source attribution. Supports complex OData filtering with boolean logic, operators, and grouping.",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "query": {"type": "string", "description": "Search query text"},
-            "filter": {
-                "type": "string",
-                "description": "Optional OData filter expression supporting complex boolean logic.\n\nAVAILABLE FIELDS:\n• Note: SourceDocumentDataSource is automatically set to 'CRS' for this tool. Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n• SourceDocumentOrg: Organization associated with the document. There are many values, use pia_search_content_facets tool to see available options\n• SourceDocumentTitle: Document title - use contains, eq for text matching\n• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n• RecStatus: Recommendation status\n• RecPriorityFlag: Priority flag for recommendations\n• IsIntegrityRelated: Whether the content is integrity-related\n• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n• RecRecommendation: Recommendation text - use contains, eq for text matching\n• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n\nOPERATORS:\n• Text: contains, eq, ne, startswith, endswith\n• Exact: eq (equals), ne (not equals), in (in list)\n• Date: ge (greater/equal), le (less/equal), eq (equals)\n• Logic: and, or, not, parentheses for grouping\n\nEXAMPLES:\n• \"RecStatus eq 'Open'\"\n• \"RecStatus ne 'Closed' and RecPriorityFlag eq 'Yes'\"\n• \"IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'\"\n• \"(RecStatus eq 'Open' and RecPriorityFlag eq 'Yes')\"\n• \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n\nTIP: Use pia_search_content_facets tool to get the most current available values.",
-            },
-            "page": {
-                "type": "integer",
-                "description": "Page number (default: 1)",
-                "default": 1,
-            },
-            "page_size": {
-                "type": "integer",
-                "description": "Results per page (default: 10)",
-                "default": 10,
-            },
-            "search_mode": {
-                "type": "string",
-                "description": "Search mode (default: content)",
-                "default": "content",
-            },
-            "limit": {"type": "integer", "description": "Maximum results limit"},
-            "include_facets": {
-                "type": "boolean",
-                "description": "Include facets in results",
-                "default": False,
-            },
-        },
-        "required": ["query"],
-    },
+pia_search_content_crs_tool = _make_source_tool(
+    "pia_search_content_crs",
+    "CRS",
+    "Congressional Research Service (CRS)",
+    "CRS",
 )
 
-pia_search_content_doj_tool = types.Tool(
-    name="pia_search_content_doj",
-    description="Search the Program Integrity Alliance (PIA) database for Department of Justice document content and recommendations. This tool automatically filters results to only include documents from the Department of Justice. Returns comprehensive results with full citation information and clickable links for proper attribution. Each result includes corresponding citations with data source attribution. Supports complex OData filtering with boolean logic, operators, and grouping.",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "query": {"type": "string", "description": "Search query text"},
-            "filter": {
-                "type": "string",
-                "description": "Optional OData filter expression supporting complex boolean logic.\n\nAVAILABLE FIELDS:\n• Note: SourceDocumentDataSource is automatically set to 'Department of Justice' for this tool. Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n• SourceDocumentOrg: Organization associated with the document. There are many values, use pia_search_content_facets tool to see available options\n• SourceDocumentTitle: Document title - use contains, eq for text matching\n• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n• RecStatus: Recommendation status\n• RecPriorityFlag: Priority flag for recommendations\n• IsIntegrityRelated: Whether the content is integrity-related\n• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n• RecRecommendation: Recommendation text - use contains, eq for text matching\n• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n\nOPERATORS:\n• Text: contains, eq, ne, startswith, endswith\n• Exact: eq (equals), ne (not equals), in (in list)\n• Date: ge (greater/equal), le (less/equal), eq (equals)\n• Logic: and, or, not, parentheses for grouping\n\nEXAMPLES:\n• \"RecStatus eq 'Open'\"\n• \"RecStatus ne 'Closed' and RecPriorityFlag eq 'Yes'\"\n• \"IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'\"\n• \"(RecStatus eq 'Open' and RecPriorityFlag eq 'Yes')\"\n• \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n\nTIP: Use pia_search_content_facets tool to get the most current available values.",
-            },
-            "page": {
-                "type": "integer",
-                "description": "Page number (default: 1)",
-                "default": 1,
-            },
-            "page_size": {
-                "type": "integer",
-                "description": "Results per page (default: 10)",
-                "default": 10,
-            },
-            "search_mode": {
-                "type": "string",
-                "description": "Search mode (default: content)",
-                "default": "content",
-            },
-            "limit": {"type": "integer", "description": "Maximum results limit"},
-            "include_facets": {
-                "type": "boolean",
-                "description": "Include facets in results",
-                "default": False,
-            },
-        },
-        "required": ["query"],
-    },
+pia_search_content_doj_tool = _make_source_tool(
+    "pia_search_content_doj",
+    "Department of Justice",
+    "the Department of Justice",
+    "Department of Justice",
 )
 
-pia_search_content_congress_tool = types.Tool(
-    name="pia_search_content_congress",
-    description="Search the Program Integrity Alliance (PIA) database for Congress.gov document content and recommendations. This tool automatically filters results to only include documents from Congress.gov. Returns comprehensive results with full citation information and clickable links for proper attribution. Each result includes corresponding citations with data source attribution. Supports complex OData filtering with boolean logic, operators, and grouping.",
-    inputSchema={
-        "type": "object",
-        "properties": {
-            "query": {"type": "string", "description": "Search query text"},
-            "filter": {
-                "type": "string",
-                "description": "Optional OData filter expression supporting complex boolean logic.\n\nAVAILABLE FIELDS:\n• Note: SourceDocumentDataSource is automatically set to 'Congress.gov' for this tool. Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n• SourceDocumentOrg: Organization associated with the document. There are many values, use pia_search_content_facets tool to see available options\n• SourceDocumentTitle: Document title - use contains, eq for text matching\n• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n• RecStatus: Recommendation status\n• RecPriorityFlag: Priority flag for recommendations\n• IsIntegrityRelated: Whether the content is integrity-related\n• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n• RecRecommendation: Recommendation text - use contains, eq for text matching\n• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n\nOPERATORS:\n• Text: contains, eq, ne, startswith, endswith\n• Exact: eq (equals), ne (not equals), in (in list)\n• Date: ge (greater/equal), le (less/equal), eq (equals)\n• Logic: and, or, not, parentheses for grouping\n\nEXAMPLES:\n• \"RecStatus eq 'Open'\"\n• \"RecStatus ne 'Closed' and RecPriorityFlag eq 'Yes'\"\n• \"IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'\"\n• \"(RecStatus eq 'Open' and RecPriorityFlag eq 'Yes')\"\n• \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n\nTIP: Use pia_search_content_facets tool to get the most current available values.",
-            },
-            "page": {
-                "type": "integer",
-                "description": "Page number (default: 1)",
-                "default": 1,
-            },
-            "page_size": {
-                "type": "integer",
-                "description": "Results per page (default: 10)",
-                "default": 10,
-            },
-            "search_mode": {
-                "type": "string",
-                "description": "Search mode (default: content)",
-                "default": "content",
-            },
-            "limit": {"type": "integer", "description": "Maximum results limit"},
-            "include_facets": {
-                "type": "boolean",
-                "description": "Include facets in results",
-                "default": False,
-            },
-        },
-        "required": ["query"],
-    },
+pia_search_content_congress_tool = _make_source_tool(
+    "pia_search_content_congress",
+    "Congress.gov",
+    "Congress.gov",
+    "Congress.gov",
 )
 
-pia_search_content_executive_orders_tool = types.Tool(
+pia_search_content_executive_orders_tool = types.Tool.model_construct(
     name="pia_search_content_executive_orders",
     description="Search the Program Integrity Alliance (PIA) database for Executive Orders document content from the Federal Register. This tool automatically filters results to only include Executive Orders from the Federal Register (https://www.federalregister.gov/). Returns comprehensive results with full citation information and clickable links for proper attribution. Each result includes corresponding citations with data source attribution. Supports complex OData filtering with boolean logic, operators, and grouping.",
     inputSchema={
         "type": "object",
         "properties": {
-            "query": {"type": "string", "description": "Search query text"},
+            "query": _QUERY_PROPERTY,
             "filter": {
                 "type": "string",
-                "description": "Optional OData filter expression supporting complex boolean logic.\n\nAVAILABLE FIELDS:\n• Note: SourceDocumentDataSource is automatically set to 'Federal Register' and SourceDocumentDataSet is set to 'executive orders' for this tool. Major sources (>1k documents): 'Department of Justice', 'Congress.gov', 'Oversight.gov', 'CRS', 'GAO', 'Federal Register'\n• SourceDocumentDataSet: Dataset or collection the document belongs to. Values: 'press-releases', 'reports', 'bills-and-laws', 'federal-reports', 'executive orders', 'state-and-local-reports', 'federal reports'\n• SourceDocumentOrg: Organization associated with the document. There are many values, use pia_search_content_facets tool to see available options\n• SourceDocumentTitle: Document title - use contains, eq for text matching\n• SourceDocumentPublishDate: Publication date - ISO 8601 format YYYY-MM-DD (e.g., '2023-01-01'). Use ge/le for ranges\n• RecStatus: Recommendation status\n• RecPriorityFlag: Priority flag for recommendations\n• IsIntegrityRelated: Whether the content is integrity-related\n• SourceDocumentIsRecDoc: Whether the document contains recommendations. Values: 'No', 'Yes'\n• RecFraudRiskManagementThemePIA: Fraud risk management theme classification\n• RecMatterForCongressPIA: Whether the matter is for Congressional attention\n• RecRecommendation: Recommendation text - use contains, eq for text matching\n• RecAgencyComments: Agency comments on recommendations - use contains, eq for text matching\n\nOPERATORS:\n• Text: contains, eq, ne, startswith, endswith\n• Exact: eq (equals), ne (not equals), in (in list)\n• Date: ge (greater/equal), le (less/equal), eq (equals)\n• Logic: and, or, not, parentheses for grouping\n\nEXAMPLES:\n• \"SourceDocumentPublishDate ge '2020-01-01'\"\n• \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n• \"IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'\"\n• \"IsIntegrityRelated eq 'True'\"\n• \"SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'\"\n\nTIP: Use pia_search_content_facets tool to get the most current available values.",
-            },
-            "page": {
-                "type": "integer",
-                "description": "Page number (default: 1)",
-                "default": 1,
-            },
-            "page_size": {
-                "type": "integer",
-                "description": "Results per page (default: 10)",
-                "default": 10,
-            },
-            "search_mode": {
-                "type": "string",
-                "description": "Search mode (default: content)",
-                "default": "content",
-            },
-            "limit": {"type": "integer", "description": "Maximum results limit"},
-            "include_facets": {
-                "type": "boolean",
-                "description": "Include facets in results",
-                "default": False,
-            },
+                "description": _odata_filter_description(
+                    "Note: SourceDocumentDataSource is automatically set to 'Federal Register' and SourceDocumentDataSet is set to 'executive orders' for this tool.",
+                    (
+                        "SourceDocumentPublishDate ge '2020-01-01'",
+                        "SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'",
+                        "IsIntegrityRelated eq 'True' and RecPriorityFlag eq 'Yes'",
+                        "IsIntegrityRelated eq 'True'",
+                        "SourceDocumentPublishDate ge '2020-01-01' and SourceDocumentPublishDate le '2024-12-31'",
+                    ),
+                ),
+            },
+            "page": _PAGE_PROPERTY,
+            "page_size": _PAGE_SIZE_PROPERTY,
+            "search_mode": _SEARCH_MODE_PROPERTY,
+            "limit": _LIMIT_PROPERTY,
+            "include_facets": _INCLUDE_FACETS_PROPERTY,
         },
         "required": ["query"],
     },
 )
 
-search_tool = types.Tool(
+search_tool = types.Tool.model_construct(
     name="search",
     description="Search the Program Integrity Alliance (PIA) database and return a list of potentially relevant search results with titles, snippets, and URLs for citation. This endpoint is one of the supported for OpenAI's MCP spec when integrating ChatGPT Connectors.",
     inputSchema={
@@ -417,7 +415,7 @@ search_tool = types.Tool(
     },
 )
 
-fetch_tool = types.Tool(
+fetch_tool = types.Tool.model_construct(
     name="fetch",
     description="Retrieve the full contents of a specific document from the PIA database using its unique identifier. This endpoint is one of the supported for OpenAI's MCP spec when integrating ChatGPT Connectors.",
     inputSchema={
@@ -433,110 +431,333 @@ fetch_tool = types.Tool(
 )
 
 
-# Handler functions - using generic handler that forwards to remote server
-async def handle_pia_search_content(
-    arguments: Dict[str, Any],
-) -> List[types.TextContent]:
-    """Handle PIA content search requests."""
-    return await _forward_to_remote("pia_search_content", arguments)
-
+# Tools answered by forwarding the call to the remote tool of the same name
+_REMOTE_TOOLS: Tuple[types.Tool, ...] = (
+    pia_search_content_tool,
+    pia_search_content_facets_tool,
+    pia_search_titles_tool,
+    pia_search_titles_facets_tool,
+    pia_search_content_gao_tool,
+    pia_search_content_oig_tool,
+    pia_search_content_crs_tool,
+    pia_search_content_doj_tool,
+    pia_search_content_congress_tool,
+    pia_search_content_executive_orders_tool,
+    search_tool,
+    fetch_tool,
+)
 
-async def handle_pia_search_content_facets(
-    arguments: Dict[str, Any],
-) -> List[types.TextContent]:
-    """Handle PIA content search facets requests."""
-    return await _forward_to_remote("pia_search_content_facets", arguments)
+# Local tool that runs several remote tool calls concurrently
+pia_batch_tool = types.Tool.model_construct(
+    name="pia_batch",
+    description="Run several independent PIA tool calls at once, for example one search per data source or several fetch calls, and return every result in the order the calls were given. Each result starts with a line naming its position and tool. Calls are made concurrently, so a batch takes about as long as its slowest call.",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "calls": {
+                "type": "array",
+                "description": "The tool calls to run",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {
+                            "type": "string",
+                            "description": "Name of the tool to call",
+                            "enum": [tool.name for tool in _REMOTE_TOOLS],
+                        },
+                        "arguments": {
+                            "type": "object",
+                            "description": "Arguments for the tool, as for a direct call",
+                        },
+                    },
+                    "required": ["name", "arguments"],
+                },
+                "minItems": 1,
+                "maxItems": settings.BATCH_SIZE,
+            }
+        },
+        "required": ["calls"],
+    },
+)
 
+# Every tool this server exposes, in the order they are listed to clients
+TOOLS: Tuple[types.Tool, ...] = (*_REMOTE_TOOLS, pia_batch_tool)
 
-async def handle_pia_search_titles(
-    arguments: Dict[str, Any],
-) -> List[types.TextContent]:
-    """Handle PIA titles search requests."""
-    return await _forward_to_remote("pia_search_titles", arguments)
+# Tool name -> input schema, used to build validators on first use
+_INPUT_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    tool.name: tool.inputSchema for tool in TOOLS
+}
 
+# Tools whose results are paginated, for PREFETCH_NEXT_PAGE
+_PAGED_TOOLS = frozenset(
+    name for name, schema in _INPUT_SCHEMAS.items() if "page" in schema["properties"]
+)
 
-async def handle_pia_search_titles_facets(
-    arguments: Dict[str, Any],
-) -> List[types.TextContent]:
-    """Handle PIA titles search facets requests."""
-    return await _forward_to_remote("pia_search_titles_facets", arguments)
 
+@functools.lru_cache(maxsize=None)
+def _validator_for(tool_name: str) -> jsonschema.protocols.Validator:
+    """Compile the input schema validator for a tool once, on first use."""
+    schema = _INPUT_SCHEMAS[tool_name]
+    return jsonschema.validators.validator_for(schema)(schema)
 
-async def handle_pia_search_content_gao(
-    arguments: Dict[str, Any],
-) -> List[types.TextContent]:
-    """Handle PIA GAO content search requests."""
-    return await _forward_to_remote("pia_search_content_gao", arguments)
 
+def validate_input(tool_name: str, arguments: Dict[str, Any]) -> None:
+    """Check tool arguments against the tool's input schema.
 
-async def handle_pia_search_content_oig(
-    arguments: Dict[str, Any],
-) -> List[types.TextContent]:
-    """Handle PIA OIG content search requests."""
-    return await _forward_to_remote("pia_search_content_oig", arguments)
+    Raises ValueError, which the MCP server reports as an error result.
+    Unknown tool names are left to the caller to reject.
+    """
+    if tool_name not in _INPUT_SCHEMAS:
+        return
+    error = jsonschema.exceptions.best_match(
+        _validator_for(tool_name).iter_errors(arguments)
+    )
+    if error is not None:
+        raise ValueError(f"Input validation error: {error.message}")
 
 
-async def handle_pia_search_content_crs(
-    arguments: Dict[str, Any],
-) -> List[types.TextContent]:
-    """Handle PIA CRS content search requests."""
-    return await _forward_to_remote("pia_search_content_crs", arguments)
+# Handler functions - using generic handler that forwards to remote server
+def _request_key(tool_name: str, arguments: Dict[str, Any]) -> str:
+    """Build a stable key identifying a tool call by name and arguments.
+
+    The canonical JSON is used as the key directly; tool arguments are small,
+    so hashing them would cost more than it saves. OData filters are
+    canonicalized first so equivalent filters share a cache entry.
+    """
+    filter_expr = arguments.get("filter")
+    if isinstance(filter_expr, str):
+        arguments = {**arguments, "filter": canonicalize_filter(filter_expr)}
+    return orjson.dumps(
+        {"t": tool_name, "a": arguments}, option=orjson.OPT_SORT_KEYS
+    ).decode()
+
+
+def _normalize_arguments(arguments: Dict[str, Any]) -> Dict[str, Any]:
+    """Prepare tool arguments before they are looked up or sent.
+
+    page_size and limit are capped at MAX_RESULTS so one call can't ask for
+    huge pages, and a blank filter is dropped since it filters nothing.
+    """
+    for field in ("page_size", "limit"):
+        value = arguments.get(field)
+        if isinstance(value, int) and value > settings.MAX_RESULTS:
+            arguments = {**arguments, field: settings.MAX_RESULTS}
+    filter_expr = arguments.get("filter")
+    if isinstance(filter_expr, str) and not filter_expr.strip():
+        arguments = {k: v for k, v in arguments.items() if k != "filter"}
+    return arguments
+
+
+def close_caches() -> None:
+    """Close the on-disk response cache, if one was opened."""
+    _persistent_cache.close()
+
+
+def _cache_ttls(tool_name: str) -> Tuple[float, float]:
+    """Return how long a tool's results are fresh, and then served stale."""
+    if tool_name in _FACETS_TOOLS:
+        return settings.FACETS_CACHE_TTL, settings.FACETS_STALE_TTL
+    return settings.CACHE_TTL, 0.0
+
+
+def _stored_key(key: str) -> str:
+    """Return the on-disk cache key for a request key.
+
+    Entries on disk outlive the process, so the key also records the API
+    they came from and the result format; otherwise changing PIA_API_URL
+    or COMPACT_RESPONSES would keep serving the old server's results or
+    the old format.
+    """
+    result_format = "compact" if settings.COMPACT_RESPONSES else "indented"
+    return f"{settings.PIA_API_URL} {result_format} {key}"
+
+
+def _start_request(
+    tool_name: str, arguments: Dict[str, Any], key: str
+) -> "asyncio.Future[List[types.TextContent]]":
+    """Return the in-flight request for key, starting one if there is none."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_call_remote(tool_name, arguments, key))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    else:
+        logger.debug("Joining in-flight request for %s", tool_name)
+    return task
 
 
-async def handle_pia_search_content_doj(
-    arguments: Dict[str, Any],
+async def _forward_to_remote(
+    tool_name: str, arguments: Dict[str, Any]
 ) -> List[types.TextContent]:
-    """Handle PIA DOJ content search requests."""
-    return await _forward_to_remote("pia_search_content_doj", arguments)
-
-
-async def handle_pia_search_content_congress(
-    arguments: Dict[str, Any],
+    """Forward tool call to remote MCP server.
+
+    With PREFETCH_NEXT_PAGE set, a successful call to a paginated tool
+    also starts fetching the following page, so a follow-up call for it
+    is answered from the cache.
+    """
+    arguments = _normalize_arguments(arguments)
+    key = _request_key(tool_name, arguments)
+    results = await _answer(tool_name, arguments, key)
+    if settings.PREFETCH_NEXT_PAGE and tool_name in _PAGED_TOOLS:
+        _prefetch_next_page(tool_name, arguments, key, results[0].text)
+    return results
+
+
+async def _answer(
+    tool_name: str, arguments: Dict[str, Any], key: str
 ) -> List[types.TextContent]:
-    """Handle PIA Congress content search requests."""
-    return await _forward_to_remote("pia_search_content_congress", arguments)
+    """Answer a tool call from the caches or, failing that, the PIA API.
+
+    Recently answered calls are served from the response cache, or from the
+    on-disk cache when one is configured, and identical calls made while a
+    request is already in flight share its result instead of issuing
+    another POST to the PIA API. Tools with a stale grace period get an
+    expired answer immediately while a fresh one is fetched in the
+    background.
+    """
+    cached = _response_cache.get(key)
+    if cached is not None:
+        logger.debug("Serving %s from response cache", tool_name)
+        return [types.TextContent(type="text", text=cached)]
+
+    stale = _response_cache.get_stale(key)
+    if stale is not None:
+        logger.debug("Serving stale %s and refreshing in background", tool_name)
+        _start_request(tool_name, arguments, key)
+        return [types.TextContent(type="text", text=stale)]
+
+    stored = None
+    if _persistent_cache.enabled:
+        stored = await asyncio.to_thread(_persistent_cache.get, _stored_key(key))
+    if stored is not None:
+        text, remaining = stored
+        if remaining > 0:
+            logger.debug("Serving %s from persistent cache", tool_name)
+            _response_cache.set(key, text, remaining, _cache_ttls(tool_name)[1])
+        else:
+            logger.debug("Serving stale %s from persistent cache", tool_name)
+            _start_request(tool_name, arguments, key)
+        return [types.TextContent(type="text", text=text)]
+
+    task = _start_request(tool_name, arguments, key)
+    # Shield the shared request so one caller being cancelled doesn't
+    # cancel it for everyone else waiting on the same result.
+    return await asyncio.shield(task)
+
+
+def _prefetch_next_page(
+    tool_name: str, arguments: Dict[str, Any], key: str, text: str
+) -> None:
+    """Start answering the page after the one cached under key, if needed.
+
+    Nothing is fetched when this page wasn't cached, i.e. the call failed,
+    when it was the last page, or when the next page is already cached or
+    in flight. The next page is answered like any call, so one already
+    kept in the on-disk cache is read from there rather than re-fetched.
+    """
+    if _response_cache.get(key) is None or _is_last_page(tool_name, arguments, text):
+        return
+    next_arguments = {**arguments, "page": arguments.get("page", 1) + 1}
+    next_key = _request_key(tool_name, next_arguments)
+    if _response_cache.get(next_key) is not None or next_key in _inflight:
+        return
+    logger.debug("Prefetching page %d of %s", next_arguments["page"], tool_name)
+    task = asyncio.ensure_future(_answer(tool_name, next_arguments, next_key))
+    _prefetches.add(task)
+    task.add_done_callback(_prefetches.discard)
+
+
+def _is_last_page(tool_name: str, arguments: Dict[str, Any], text: str) -> bool:
+    """Whether a result is known to hold the last page of its search.
+
+    A page is the last one when it reaches the output's total_count, or
+    when its list of results is shorter than page_size. A result that
+    shows neither is assumed to have a successor.
+    """
+    try:
+        result = orjson.loads(text)
+        # A tool result carries its structured output in structuredContent
+        structured = result.get("structuredContent", result)
+        output = structured.get("output", structured)
+    except (orjson.JSONDecodeError, AttributeError):
+        return False
+    if not isinstance(output, dict):
+        return False
+    page = arguments.get("page", 1)
+    page_size = arguments.get("page_size", _PAGE_SIZE_PROPERTY["default"])
+    total_count = output.get("total_count")
+    if isinstance(total_count, int) and page * page_size >= total_count:
+        return True
+    for field in ("results", "documents"):
+        items = output.get(field)
+        if isinstance(items, list):
+            return len(items) < page_size
+    return False
+
+
+def _error_body(response: httpx.Response) -> str:
+    """Return the response body for an error message, truncated if large."""
+    text = response.text
+    if len(text) > _MAX_ERROR_BODY_CHARS:
+        return text[:_MAX_ERROR_BODY_CHARS] + "... (truncated)"
+    return text
+
+
+def _request_body(tool_name: str, arguments: Dict[str, Any]) -> bytes:
+    """Encode the JSON-RPC request that calls tool_name on the PIA API."""
+    return b"".join(
+        (
+            _ENVELOPE_PREFIX,
+            orjson.dumps(tool_name),
+            _ENVELOPE_ARGUMENTS,
+            orjson.dumps(arguments),
+            _ENVELOPE_SUFFIX,
+        )
+    )
 
 
-async def handle_pia_search_content_executive_orders(
-    arguments: Dict[str, Any],
-) -> List[types.TextContent]:
-    """Handle PIA Executive Orders content search requests."""
-    return await _forward_to_remote("pia_search_content_executive_orders", arguments)
+@functools.lru_cache(maxsize=1)
+def _request_headers() -> Dict[str, str]:
+    """Build the headers sent with every PIA API request.
 
+    Only a successful lookup is cached; a missing API key raises ValueError
+    every time so it can be configured without restarting the server.
+    """
+    return {"Content-Type": "application/json", "x-api-key": settings.API_KEY}
 
-async def handle_search(
-    arguments: Dict[str, Any],
-) -> List[types.TextContent]:
-    """Handle simple search requests."""
-    return await _forward_to_remote("search", arguments)
 
+async def _post(content: bytes, headers: Dict[str, str]) -> httpx.Response:
+    """POST a request to the PIA API, retrying once if the connection fails.
 
-async def handle_fetch(
-    arguments: Dict[str, Any],
-) -> List[types.TextContent]:
-    """Handle fetch document requests."""
-    return await _forward_to_remote("fetch", arguments)
+    Each attempt waits for a free request slot, so at most
+    MAX_CONCURRENT_REQUESTS requests are in flight at once.
 
+    Tool calls only read data, so a request whose connection could not be
+    opened or was dropped before a response is safe to send again.
+    """
+    client = get_client()
+    slots = get_request_slots()
+    try:
+        async with slots:
+            return await client.post(
+                settings.PIA_API_URL, content=content, headers=headers
+            )
+    except (httpx.ConnectError, httpx.RemoteProtocolError) as e:
+        logger.warning("Retrying PIA API request after connection error: %s", e)
+        await asyncio.sleep(_RETRY_DELAY)
+        async with slots:
+            return await client.post(
+                settings.PIA_API_URL, content=content, headers=headers
+            )
 
-async def _forward_to_remote(
-    tool_name: str, arguments: Dict[str, Any]
+
+async def _call_remote(
+    tool_name: str, arguments: Dict[str, Any], cache_key: str
 ) -> List[types.TextContent]:
-    """Forward tool call to remote MCP server."""
+    """Send a single tool call to the remote MCP server."""
     try:
-        # Prepare the request payload
-        payload = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {"name": tool_name, "arguments": arguments},
-        }
-
         try:
-            api_key = settings.API_KEY
-            logger.info(
-                "API_KEY retrieved successfully: %s...",
-                api_key[:10] if api_key else "API_KEY is None or empty",
-            )
+            headers = _request_headers()
         except ValueError as e:
             logger.error("Failed to retrieve API key: %s", str(e))
             return [
@@ -546,45 +767,107 @@ async def _forward_to_remote(
                 )
             ]
 
-        headers = {"Content-Type": "application/json", "x-api-key": api_key}
-        logger.info(
-            "Making API call to %s with headers: %s",
-            settings.PIA_API_URL,
-            dict(headers),
-        )
-
-        async with httpx.AsyncClient(timeout=settings.REQUEST_TIMEOUT) as client:
-            response = await client.post(
-                settings.PIA_API_URL, json=payload, headers=headers
-            )
-            response.raise_for_status()
-
-            result = response.json()
-
-            if "error" in result:
-                error_msg = result["error"].get("message", "Unknown error")
-                return [types.TextContent(type="text", text=f"API Error: {error_msg}")]
-
-            if "result" in result:
-                # Format the search results nicely
-                search_results = result["result"]
-                formatted_result = json.dumps(
-                    search_results, indent=2, ensure_ascii=False
+        logger.debug("Making API call to %s", settings.PIA_API_URL)
+
+        response = await _post(_request_body(tool_name, arguments), headers)
+        logger.debug("%s answered over %s", tool_name, response.http_version)
+        response.raise_for_status()
+
+        result = orjson.loads(response.content)
+
+        if "error" in result:
+            error_msg = result["error"].get("message", "Unknown error")
+            return [types.TextContent(type="text", text=f"API Error: {error_msg}")]
+
+        if "result" in result:
+            # Format the search results nicely
+            search_results = result["result"]
+            formatted_result = orjson.dumps(
+                search_results,
+                option=None if settings.COMPACT_RESPONSES else orjson.OPT_INDENT_2,
+            ).decode()
+            ttl, stale_ttl = _cache_ttls(tool_name)
+            _response_cache.set(cache_key, formatted_result, ttl, stale_ttl)
+            if _persistent_cache.enabled:
+                await asyncio.to_thread(
+                    _persistent_cache.set,
+                    _stored_key(cache_key),
+                    formatted_result,
+                    ttl,
+                    stale_ttl,
                 )
-                return [types.TextContent(type="text", text=formatted_result)]
-            else:
-                return [
-                    types.TextContent(type="text", text="No results returned from API")
-                ]
+            return [types.TextContent(type="text", text=formatted_result)]
+        else:
+            return [types.TextContent(type="text", text="No results returned from API")]
 
     except httpx.HTTPStatusError as e:
         logger.error("HTTP error during %s: %s", tool_name, e)
         return [
             types.TextContent(
                 type="text",
-                text=f"HTTP Error {e.response.status_code}: {e.response.text}",
+                text=f"HTTP Error {e.response.status_code}: {_error_body(e.response)}",
             )
         ]
+    except httpx.RequestError as e:
+        logger.error("Request error during %s: %s", tool_name, e)
+        return [types.TextContent(type="text", text=f"Error: {str(e)}")]
     except Exception as e:
-        logger.error("Error during %s: %s", tool_name, e)
+        logger.error("Error during %s: %s", tool_name, e, exc_info=True)
         return [types.TextContent(type="text", text=f"Error: {str(e)}")]
+
+
+# Tool name -> handler, used by the server to dispatch tool calls. Every
+# remote tool's handler just forwards its arguments to the tool of the same
+# name; pia_batch is added below.
+TOOL_HANDLERS: Dict[
+    str, Callable[[Dict[str, Any]], Awaitable[List[types.TextContent]]]
+] = {
+    tool.name: functools.partial(_forward_to_remote, tool.name)
+    for tool in _REMOTE_TOOLS
+}
+
+handle_pia_search_content = TOOL_HANDLERS["pia_search_content"]
+handle_pia_search_content_facets = TOOL_HANDLERS["pia_search_content_facets"]
+handle_pia_search_titles = TOOL_HANDLERS["pia_search_titles"]
+handle_pia_search_titles_facets = TOOL_HANDLERS["pia_search_titles_facets"]
+handle_pia_search_content_gao = TOOL_HANDLERS["pia_search_content_gao"]
+handle_pia_search_content_oig = TOOL_HANDLERS["pia_search_content_oig"]
+handle_pia_search_content_crs = TOOL_HANDLERS["pia_search_content_crs"]
+handle_pia_search_content_doj = TOOL_HANDLERS["pia_search_content_doj"]
+handle_pia_search_content_congress = TOOL_HANDLERS["pia_search_content_congress"]
+handle_pia_search_content_executive_orders = TOOL_HANDLERS[
+    "pia_search_content_executive_orders"
+]
+handle_search = TOOL_HANDLERS["search"]
+handle_fetch = TOOL_HANDLERS["fetch"]
+
+
+async def _run_batch_call(name: str, arguments: Dict[str, Any]) -> str:
+    """Run one call of a batch and return its result as text."""
+    try:
+        validate_input(name, arguments)
+        results = await TOOL_HANDLERS[name](arguments)
+    except Exception as e:
+        return f"Error: {str(e)}"
+    return "\n".join(result.text for result in results)
+
+
+async def handle_pia_batch(arguments: Dict[str, Any]) -> List[types.TextContent]:
+    """Run a batch of remote tool calls concurrently.
+
+    A call that fails only produces an error entry for that call; the rest
+    of the batch still completes.
+    """
+    calls = arguments["calls"]
+    texts = await asyncio.gather(
+        *(_run_batch_call(call["name"], call["arguments"]) for call in calls)
+    )
+    return [
+        types.TextContent(
+            type="text", text=f"[{index}/{len(calls)}] {call['name']}\n{text}"
+        )
+        for index, (call, text) in enumerate(zip(calls, texts), start=1)
+    ]
+
+
+TOOL_HANDLERS["pia_batch"] = handle_pia_batch
@@ -0,0 +1,41 @@
+"""Shared fixtures for the PIA MCP Server tests."""
+
+import pytest
+from pia_mcp_server.config import settings
+from pia_mcp_server.tools import http_client, search_tools
+from pia_mcp_server.tools.cache import PersistentCache
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings(monkeypatch):
+    """Forget the shared settings' cached API key so it cannot leak."""
+    monkeypatch.setattr(settings, "_api_key", None)
+
+
+@pytest.fixture(autouse=True)
+def fresh_http_client(monkeypatch):
+    """Make each test build its own shared client from the patched httpx."""
+    monkeypatch.setattr(http_client, "_client", None)
+    monkeypatch.setattr(http_client, "_request_slots", None)
+
+
+@pytest.fixture(autouse=True)
+def empty_response_cache():
+    """Keep cached responses from one test out of the next."""
+    search_tools._response_cache.clear()
+    yield
+    search_tools._response_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def no_persistent_cache(monkeypatch):
+    """Keep tests from reading or writing an on-disk response cache."""
+    monkeypatch.setattr(search_tools, "_persistent_cache", PersistentCache(None))
+
+
+@pytest.fixture(autouse=True)
+def fresh_request_headers():
+    """Resolve the API key headers again for each test's settings."""
+    search_tools._request_headers.cache_clear()
+    yield
+    search_tools._request_headers.cache_clear()
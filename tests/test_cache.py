@@ -0,0 +1,147 @@
+"""Tests for the response cache."""
+
+from unittest.mock import patch
+from pia_mcp_server.tools.cache import PersistentCache, TTLCache
+
+
+def test_get_returns_stored_value():
+    """Test that a stored value is returned before it expires."""
+    cache = TTLCache()
+    cache.set("key", "value", ttl=60)
+
+    assert cache.get("key") == "value"
+    assert cache.get("missing") is None
+
+
+def test_entries_expire():
+    """Test that entries are dropped once their TTL has passed."""
+    cache = TTLCache()
+    with patch("pia_mcp_server.tools.cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value", ttl=10)
+    with patch("pia_mcp_server.tools.cache.time.monotonic", return_value=110.0):
+        assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    """Test that the cache stays within max_size by evicting LRU entries."""
+    cache = TTLCache(max_size=2)
+    cache.set("a", "1", ttl=60)
+    cache.set("b", "2", ttl=60)
+    cache.get("a")
+    cache.set("c", "3", ttl=60)
+
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+
+
+def test_zero_ttl_disables_caching():
+    """Test that a TTL of zero stores nothing."""
+    cache = TTLCache()
+    cache.set("key", "value", ttl=0)
+
+    assert cache.get("key") is None
+
+
+def test_expired_entry_served_stale_within_grace_period():
+    """Test that get_stale returns expired entries until the grace period ends."""
+    cache = TTLCache()
+    with patch("pia_mcp_server.tools.cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value", ttl=10, stale_ttl=5)
+        assert cache.get_stale("key") is None
+    with patch("pia_mcp_server.tools.cache.time.monotonic", return_value=112.0):
+        assert cache.get("key") is None
+        assert cache.get_stale("key") == "value"
+    with patch("pia_mcp_server.tools.cache.time.monotonic", return_value=115.0):
+        assert cache.get_stale("key") is None
+
+
+def test_persistent_cache_survives_reopen(tmp_path):
+    """Test that stored values are read back by a new cache on the same file."""
+    path = str(tmp_path / "cache.db")
+    cache = PersistentCache(path)
+    cache.set("key", "value", ttl=60)
+    cache.close()
+
+    reopened = PersistentCache(path)
+    value, remaining = reopened.get("key")
+    reopened.close()
+
+    assert value == "value"
+    assert 0 < remaining <= 60
+
+
+def test_persistent_cache_entries_expire(tmp_path):
+    """Test that expired entries on disk are not returned."""
+    cache = PersistentCache(str(tmp_path / "cache.db"))
+    with patch("pia_mcp_server.tools.cache.time.time", return_value=100.0):
+        cache.set("key", "value", ttl=10)
+    with patch("pia_mcp_server.tools.cache.time.time", return_value=110.0):
+        assert cache.get("key") is None
+    cache.close()
+
+
+def test_persistent_cache_prunes_expired_rows_on_open(tmp_path):
+    """Test that expired rows are deleted from the file when it is reopened."""
+    path = str(tmp_path / "cache.db")
+    cache = PersistentCache(path)
+    with patch("pia_mcp_server.tools.cache.time.time", return_value=100.0):
+        cache.set("old", "value", ttl=10)
+        cache.set("new", "value", ttl=1000)
+    cache.close()
+
+    with patch("pia_mcp_server.tools.cache.time.time", return_value=500.0):
+        reopened = PersistentCache(path)
+        assert reopened.get("new") is not None
+    keys = [row[0] for row in reopened._conn.execute("SELECT key FROM pia_cache")]
+    reopened.close()
+
+    assert keys == ["new"]
+
+
+def test_persistent_cache_is_trimmed_to_max_rows(tmp_path):
+    """Test that pruning keeps at most max_rows rows, dropping the oldest."""
+    cache = PersistentCache(str(tmp_path / "cache.db"), max_rows=2, prune_every=1)
+    cache.set("a", "1", ttl=10)
+    cache.set("b", "2", ttl=20)
+    cache.set("c", "3", ttl=30)
+
+    assert cache.get("a") is None
+    assert cache.get("b")[0] == "2"
+    assert cache.get("c")[0] == "3"
+    cache.close()
+
+
+def test_persistent_cache_keeps_stale_rows_for_grace_period(tmp_path):
+    """Test that expired rows are returned, as stale, until the grace ends."""
+    cache = PersistentCache(str(tmp_path / "cache.db"))
+    with patch("pia_mcp_server.tools.cache.time.time", return_value=100.0):
+        cache.set("key", "value", ttl=10, stale_ttl=5)
+    with patch("pia_mcp_server.tools.cache.time.time", return_value=112.0):
+        assert cache.get("key") == ("value", -2.0)
+    with patch("pia_mcp_server.tools.cache.time.time", return_value=115.0):
+        assert cache.get("key") is None
+    cache.close()
+
+
+def test_persistent_cache_without_path_stores_nothing():
+    """Test that a cache with no path is a no-op."""
+    cache = PersistentCache(None)
+    cache.set("key", "value", ttl=60)
+
+    assert cache.get("key") is None
+
+
+def test_total_size_is_bounded():
+    """Test that LRU entries are evicted once values exceed max_chars."""
+    cache = TTLCache(max_chars=10)
+    cache.set("a", "12345", ttl=60)
+    cache.set("b", "12345", ttl=60)
+    cache.set("c", "123", ttl=60)
+    cache.set("huge", "x" * 11, ttl=60)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "12345"
+    assert cache.get("c") == "123"
+    assert cache.get("huge") is None
@@ -33,3 +33,24 @@ def test_api_key_from_args(monkeypatch):
     settings = Settings()
 
     assert settings.API_KEY == "test_key_123"
+
+
+def test_api_key_is_cached(monkeypatch):
+    """Test API key is resolved once and reused."""
+    import sys
+
+    monkeypatch.setattr(sys, "argv", ["pia-mcp-server", "--api-key", "first_key"])
+    settings = Settings()
+    assert settings.API_KEY == "first_key"
+
+    monkeypatch.setattr(sys, "argv", ["pia-mcp-server", "--api-key", "second_key"])
+    assert settings.API_KEY == "first_key"
+
+
+def test_api_key_option_without_value(monkeypatch):
+    """Test --api-key as the last argument is ignored."""
+    import sys
+
+    monkeypatch.setattr(sys, "argv", ["pia-mcp-server", "--verbose", "--api-key"])
+
+    assert Settings()._get_api_key_from_args() is None
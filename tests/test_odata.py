@@ -0,0 +1,47 @@
+"""Tests for OData filter canonicalization."""
+
+from pia_mcp_server.tools.odata import canonicalize_filter
+
+
+def test_operand_order_and_whitespace_are_normalized():
+    """Test that reordered and re-spaced filters share a canonical form."""
+    assert canonicalize_filter("B eq 'y'   and A eq 'x'") == canonicalize_filter(
+        "A eq 'x' and B eq 'y'"
+    )
+
+
+def test_nested_groups_are_sorted():
+    """Test that operands inside parenthesized groups are sorted too."""
+    assert canonicalize_filter(
+        "C eq 'z' and (B eq 'y' or A eq 'x')"
+    ) == canonicalize_filter("(A eq 'x' or B eq 'y') and C eq 'z'")
+
+
+def test_precedence_is_preserved():
+    """Test that grouping which changes the meaning is kept."""
+    assert canonicalize_filter("(A eq 1 or B eq 2) and C eq 3") != (
+        canonicalize_filter("A eq 1 or B eq 2 and C eq 3")
+    )
+    assert canonicalize_filter("((A eq 1))") == "A eq 1"
+
+
+def test_string_literals_and_function_calls_are_untouched():
+    """Test that quoted text and function arguments are kept verbatim."""
+    expr = "contains(SourceDocumentTitle, 'fraud  and abuse') and RecStatus eq 'Open'"
+
+    assert canonicalize_filter(expr) == (
+        "RecStatus eq 'Open' and contains(SourceDocumentTitle, 'fraud  and abuse')"
+    )
+
+
+def test_unparseable_filter_is_returned_unchanged():
+    """Test that malformed filters fall back to the original text."""
+    assert canonicalize_filter("(A eq 'x  y'") == "(A eq 'x  y'"
+
+
+def test_not_keeps_its_operand_grouped():
+    """Test that "not (A eq 1)" and "not A eq 1", which differ, stay distinct."""
+    assert canonicalize_filter("not (A eq 1)") == "not (A eq 1)"
+    assert canonicalize_filter("not A eq 1") == "not A eq 1"
+    assert canonicalize_filter("not (contains(T, 'a b'))") == "not contains(T, 'a b')"
+    assert canonicalize_filter("not (IsOpen)") == "not IsOpen"
@@ -0,0 +1,53 @@
+"""Tests for prompts module."""
+
+import pytest
+from pia_mcp_server.prompts.handlers import (
+    AVAILABLE_PROMPTS,
+    get_prompt,
+    list_prompts,
+)
+
+
+@pytest.mark.asyncio
+async def test_list_prompts():
+    """Test listing all available prompts."""
+    prompts = await list_prompts()
+
+    assert [p.name for p in prompts] == [p.name for p in AVAILABLE_PROMPTS]
+    assert all(p.description for p in prompts)
+
+
+@pytest.mark.asyncio
+async def test_list_prompts_reuses_prebuilt_objects():
+    """Test that repeated calls return the prompts built at import."""
+    first = await list_prompts()
+    second = await list_prompts()
+
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_get_prompt():
+    """Test retrieving a prompt by name."""
+    result = await get_prompt("summarization_guidance")
+
+    assert result.description == AVAILABLE_PROMPTS[0].description
+    assert len(result.messages) == 1
+    assert result.messages[0].role == "user"
+    assert "References" in result.messages[0].content.text
+
+
+@pytest.mark.asyncio
+async def test_get_prompt_reuses_prebuilt_result():
+    """Test that repeated calls return the result built at import."""
+    first = await get_prompt("content_search_guidance")
+    second = await get_prompt("content_search_guidance")
+
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_get_prompt_unknown_name():
+    """Test retrieving an unknown prompt raises an error."""
+    with pytest.raises(ValueError, match="Prompt 'missing' not found"):
+        await get_prompt("missing")
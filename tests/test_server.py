@@ -22,3 +22,53 @@ async def test_basic_functionality():
     # This is a placeholder test that ensures the module structure is correct
     # More detailed tests should be added as the codebase stabilizes
     assert True
+
+
+@pytest.mark.asyncio
+async def test_call_tool_dispatches_to_handler():
+    """Test that call_tool routes a known tool name to its handler."""
+    from unittest.mock import AsyncMock, patch
+    from pia_mcp_server import server
+
+    handler = AsyncMock(return_value=["ok"])
+    with patch.dict(server.TOOL_HANDLERS, {"fetch": handler}):
+        result = await server.call_tool("fetch", {"id": "doc-1"})
+
+    handler.assert_awaited_once_with({"id": "doc-1"})
+    assert result == ["ok"]
+
+
+@pytest.mark.asyncio
+async def test_call_tool_unknown_tool():
+    """Test that call_tool reports unknown tool names."""
+    from pia_mcp_server import server
+
+    result = await server.call_tool("no_such_tool", {})
+
+    assert len(result) == 1
+    assert result[0].text == "Error: Unknown tool no_such_tool"
+
+
+@pytest.mark.asyncio
+async def test_list_tools():
+    """Test that every listed tool has a dispatch handler."""
+    from pia_mcp_server import server
+
+    tools = await server.list_tools()
+
+    assert len(tools) == 13
+    assert {tool.name for tool in tools} == set(server.TOOL_HANDLERS)
+
+
+@pytest.mark.asyncio
+async def test_call_tool_rejects_invalid_arguments():
+    """Test that arguments not matching the input schema are rejected."""
+    from unittest.mock import AsyncMock, patch
+    from pia_mcp_server import server
+
+    handler = AsyncMock()
+    with patch.dict(server.TOOL_HANDLERS, {"fetch": handler}):
+        with pytest.raises(ValueError, match="Input validation error"):
+            await server.call_tool("fetch", {})
+
+    handler.assert_not_awaited()
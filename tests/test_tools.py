@@ -1,5 +1,7 @@
 """Tests for tools module."""
 
+import asyncio
+import json
 import os
 import pytest
 from unittest.mock import AsyncMock, patch, Mock
@@ -17,8 +19,10 @@ from pia_mcp_server.tools.search_tools import (
     handle_pia_search_content_executive_orders,
     handle_search,
     handle_fetch,
+    handle_pia_batch,
 )
 from pia_mcp_server.config import Settings
+from pia_mcp_server.tools.http_client import close_client
 
 settings = Settings()
 
@@ -51,12 +55,12 @@ async def test_pia_search_content_success():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content({"query": "test fraud"})
 
@@ -85,12 +89,12 @@ async def test_pia_search_content_with_odata_filter():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Test with actual field names from the remote implementation
             result = await handle_pia_search_content(
@@ -100,7 +104,7 @@ async def test_pia_search_content_with_odata_filter():
             # Verify the request was made with the filter
             mock_client_instance.post.assert_called_once()
             call_args = mock_client_instance.post.call_args
-            request_data = call_args[1]["json"]
+            request_data = json.loads(call_args[1]["content"])
             assert (
                 request_data["params"]["arguments"]["filter"]
                 == "SourceDocumentDataSource eq 'GAO'"
@@ -131,12 +135,12 @@ async def test_pia_search_content_with_complex_odata_filter():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Test complex boolean logic filter
             complex_filter = "(SourceDocumentDataSource eq 'GAO' or SourceDocumentDataSource eq 'Oversight.gov') and RecPriorityFlag in ('High', 'Critical')"
@@ -147,7 +151,7 @@ async def test_pia_search_content_with_complex_odata_filter():
             # Verify the complex filter was passed correctly
             mock_client_instance.post.assert_called_once()
             call_args = mock_client_instance.post.call_args
-            request_data = call_args[1]["json"]
+            request_data = json.loads(call_args[1]["content"])
             assert request_data["params"]["arguments"]["filter"] == complex_filter
 
             assert len(result) == 1
@@ -166,12 +170,12 @@ async def test_pia_search_content_api_error():
     with patch.object(Settings, "_get_api_key_from_args", return_value="invalid_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content({"query": "test"})
 
@@ -194,7 +198,7 @@ async def test_pia_search_content_http_error():
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.side_effect = http_error
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content({"query": "test"})
 
@@ -232,12 +236,12 @@ async def test_pia_search_content_facets_success():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content_facets({"query": "healthcare"})
 
@@ -265,12 +269,12 @@ async def test_pia_search_content_facets_with_filter():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Test facets with filter parameter
             result = await handle_pia_search_content_facets(
@@ -283,7 +287,7 @@ async def test_pia_search_content_facets_with_filter():
             # Verify the filter was passed correctly
             mock_client_instance.post.assert_called_once()
             call_args = mock_client_instance.post.call_args
-            request_data = call_args[1]["json"]
+            request_data = json.loads(call_args[1]["content"])
             assert (
                 request_data["params"]["arguments"]["filter"]
                 == "SourceDocumentDataSource eq 'GAO' and RecStatus ne 'Closed'"
@@ -306,12 +310,12 @@ async def test_pia_search_content_facets_api_error():
     with patch.object(Settings, "_get_api_key_from_args", return_value="invalid_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content_facets({"query": "test"})
 
@@ -334,7 +338,7 @@ async def test_pia_search_content_facets_http_error():
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.side_effect = http_error
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content_facets({"query": "test"})
 
@@ -359,12 +363,12 @@ async def test_pia_search_content_empty_filter():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Test with empty filter (should work normally)
             result = await handle_pia_search_content(
@@ -392,12 +396,12 @@ async def test_pia_search_content_with_all_parameters():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Test with all parameters
             result = await handle_pia_search_content(
@@ -415,7 +419,7 @@ async def test_pia_search_content_with_all_parameters():
             # Verify all parameters were passed correctly
             mock_client_instance.post.assert_called_once()
             call_args = mock_client_instance.post.call_args
-            request_data = call_args[1]["json"]
+            request_data = json.loads(call_args[1]["content"])
             arguments = request_data["params"]["arguments"]
 
             assert arguments["query"] == "comprehensive test"
@@ -450,12 +454,12 @@ async def test_pia_search_content_facets_empty_filter():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             # Test facets with empty filter
             result = await handle_pia_search_content_facets(
@@ -484,12 +488,12 @@ async def test_pia_search_content_gao_success():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content_gao({"query": "audit"})
 
@@ -518,12 +522,12 @@ async def test_pia_search_content_oig_success():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content_oig({"query": "oversight"})
 
@@ -548,12 +552,12 @@ async def test_pia_search_content_crs_success():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content_crs({"query": "research"})
 
@@ -582,12 +586,12 @@ async def test_pia_search_content_doj_success():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content_doj({"query": "enforcement"})
 
@@ -616,12 +620,12 @@ async def test_pia_search_content_congress_success():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content_congress({"query": "legislation"})
 
@@ -650,12 +654,12 @@ async def test_pia_search_content_executive_orders_success():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_pia_search_content_executive_orders(
                 {"query": "cybersecurity"}
@@ -682,12 +686,12 @@ async def test_fetch_success():
     with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
         with patch("httpx.AsyncClient") as mock_client:
             mock_response_obj = Mock()
-            mock_response_obj.json.return_value = mock_response
+            mock_response_obj.content = json.dumps(mock_response).encode()
             mock_response_obj.raise_for_status.return_value = None
 
             mock_client_instance = AsyncMock()
             mock_client_instance.post.return_value = mock_response_obj
-            mock_client.return_value.__aenter__.return_value = mock_client_instance
+            mock_client.return_value = mock_client_instance
 
             result = await handle_fetch({"id": "doc-123"})
 
@@ -741,9 +745,678 @@ async def test_agency_tools_http_error():
                     request=Mock(),
                     response=Mock(status_code=500, text="Server Error"),
                 )
-                mock_client.return_value.__aenter__.return_value = mock_client_instance
+                mock_client.return_value = mock_client_instance
 
                 result = await tool_handler(args)
 
                 assert len(result) == 1
                 assert "HTTP Error 500" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_http_client_reused_across_calls():
+    """Test that consecutive tool calls share one HTTP client."""
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": []}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            await handle_pia_search_content({"query": "first"})
+            await handle_pia_search_content({"query": "second"})
+
+            mock_client.assert_called_once()
+            assert mock_client_instance.post.call_count == 2
+
+            await close_client()
+
+            mock_client_instance.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_request():
+    """Test that identical in-flight tool calls are coalesced."""
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": []}}
+    release = asyncio.Event()
+
+    async def slow_post(*args, **kwargs):
+        await release.wait()
+        return mock_response_obj
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.side_effect = slow_post
+            mock_client.return_value = mock_client_instance
+
+            calls = [
+                asyncio.ensure_future(handle_pia_search_content({"query": "same"}))
+                for _ in range(3)
+            ]
+            other = asyncio.ensure_future(
+                handle_pia_search_content({"query": "different"})
+            )
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*calls, other)
+
+            assert mock_client_instance.post.call_count == 2
+            assert results[0] == results[1] == results[2]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_bounded(monkeypatch):
+    """Test that no more than MAX_CONCURRENT_REQUESTS posts run at once."""
+    from pia_mcp_server.tools import search_tools
+
+    monkeypatch.setattr(search_tools.settings, "MAX_CONCURRENT_REQUESTS", 2)
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": []}}
+    running = 0
+    peak = 0
+
+    async def slow_post(*args, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return mock_response_obj
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.side_effect = slow_post
+            mock_client.return_value = mock_client_instance
+
+            await asyncio.gather(
+                *(handle_pia_search_content({"query": f"q{i}"}) for i in range(5))
+            )
+
+            assert mock_client_instance.post.call_count == 5
+            assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_repeated_call_served_from_cache():
+    """Test that a repeated successful call does not hit the API again."""
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"facets": {}}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            first = await handle_pia_search_content_facets({"query": "test"})
+            second = await handle_pia_search_content_facets({"query": "test"})
+
+            mock_client_instance.post.assert_called_once()
+            assert first[0].text == second[0].text
+
+
+@pytest.mark.asyncio
+async def test_http_error_body_is_truncated():
+    """Test that large upstream error bodies are cut short."""
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = AsyncMock()
+            mock_response_obj.status_code = 502
+            mock_response_obj.text = "x" * 10000
+
+            http_error = httpx.HTTPStatusError(
+                "502 Bad Gateway", request=AsyncMock(), response=mock_response_obj
+            )
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.post.side_effect = http_error
+            mock_client.return_value = mock_client_instance
+
+            result = await handle_pia_search_content({"query": "test"})
+
+            assert result[0].text.startswith("HTTP Error 502: ")
+            assert result[0].text.endswith("... (truncated)")
+            assert len(result[0].text) < 2100
+
+
+@pytest.mark.asyncio
+async def test_stale_facets_served_while_refreshing():
+    """Test that expired facets are returned at once and refreshed in the background."""
+    from pia_mcp_server.tools import search_tools
+
+    old_response = {"jsonrpc": "2.0", "id": 1, "result": {"facets": "old"}}
+    new_response = {"jsonrpc": "2.0", "id": 1, "result": {"facets": "new"}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(old_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            with patch("pia_mcp_server.tools.cache.time.monotonic", return_value=0.0):
+                await handle_pia_search_content_facets({"query": "test"})
+
+            mock_response_obj.content = json.dumps(new_response).encode()
+            expired = search_tools.settings.FACETS_CACHE_TTL + 1
+            with patch(
+                "pia_mcp_server.tools.cache.time.monotonic", return_value=expired
+            ):
+                stale = await handle_pia_search_content_facets({"query": "test"})
+                await asyncio.gather(*search_tools._inflight.values())
+                fresh = await handle_pia_search_content_facets({"query": "test"})
+
+            assert "old" in stale[0].text
+            assert "new" in fresh[0].text
+            assert mock_client_instance.post.call_count == 2
+
+
+def test_validate_input():
+    """Test that tool arguments are checked against the input schema."""
+    from pia_mcp_server.tools import validate_input
+
+    validate_input("fetch", {"id": "doc-1"})
+    with pytest.raises(ValueError, match="'id' is a required property"):
+        validate_input("fetch", {})
+
+
+@pytest.mark.asyncio
+async def test_equivalent_filters_share_cache_entry():
+    """Test that reordered OData filters are served from the same cache entry."""
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": []}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            await handle_pia_search_content(
+                {"query": "test", "filter": "A eq 'x' and B eq 'y'"}
+            )
+            await handle_pia_search_content(
+                {"query": "test", "filter": "B eq 'y' and  A eq 'x'"}
+            )
+
+            mock_client_instance.post.assert_called_once()
+            request_data = json.loads(mock_client_instance.post.call_args[1]["content"])
+            assert request_data["params"]["arguments"]["filter"] == (
+                "A eq 'x' and B eq 'y'"
+            )
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_survives_memory_cache_loss(tmp_path, monkeypatch):
+    """Test that responses kept on disk are served once memory is cleared."""
+    from pia_mcp_server.tools import search_tools
+    from pia_mcp_server.tools.cache import PersistentCache
+
+    persistent = PersistentCache(str(tmp_path / "cache.db"))
+    monkeypatch.setattr(search_tools, "_persistent_cache", persistent)
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": []}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            first = await handle_pia_search_content({"query": "test"})
+            search_tools._response_cache.clear()
+            second = await handle_pia_search_content({"query": "test"})
+
+            mock_client_instance.post.assert_called_once()
+            assert first[0].text == second[0].text
+    persistent.close()
+
+
+@pytest.mark.asyncio
+async def test_pia_batch_runs_calls_concurrently():
+    """Test that a batch returns one result per call, in order."""
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": []}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            result = await handle_pia_batch(
+                {
+                    "calls": [
+                        {"name": "fetch", "arguments": {"id": "a"}},
+                        {"name": "fetch", "arguments": {}},
+                        {"name": "search", "arguments": {"query": "fraud"}},
+                    ]
+                }
+            )
+
+            assert mock_client_instance.post.call_count == 2
+            assert [r.text.split("\n", 1)[0] for r in result] == [
+                "[1/3] fetch",
+                "[2/3] fetch",
+                "[3/3] search",
+            ]
+            assert "Input validation error" in result[1].text
+            assert '"documents"' in result[2].text
+
+
+@pytest.mark.asyncio
+async def test_oversized_page_size_is_capped():
+    """Test that page_size and limit above MAX_RESULTS are capped."""
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": []}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            await handle_pia_search_content(
+                {"query": "test", "page_size": 10000, "limit": 5}
+            )
+
+            request_data = json.loads(mock_client_instance.post.call_args[1]["content"])
+            arguments = request_data["params"]["arguments"]
+            assert arguments["page_size"] == settings.MAX_RESULTS
+            assert arguments["limit"] == 5
+
+
+@pytest.mark.asyncio
+async def test_blank_filter_is_dropped():
+    """Test that a whitespace-only filter is not sent to the API."""
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": []}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            await handle_pia_search_content({"query": "test", "filter": "  "})
+            await handle_pia_search_content({"query": "test"})
+
+            mock_client_instance.post.assert_called_once()
+            request_data = json.loads(mock_client_instance.post.call_args[1]["content"])
+            assert "filter" not in request_data["params"]["arguments"]
+
+
+def test_page_below_one_is_rejected():
+    """Test that a page number below 1 fails input validation."""
+    from pia_mcp_server.tools.search_tools import validate_input
+
+    with pytest.raises(ValueError, match="Input validation error"):
+        validate_input("pia_search_content", {"query": "test", "page": 0})
+
+
+@pytest.mark.asyncio
+async def test_dropped_connection_is_retried_once(monkeypatch):
+    """Test that a connection error is retried once before giving up."""
+    from pia_mcp_server.tools import search_tools
+
+    monkeypatch.setattr(search_tools, "_RETRY_DELAY", 0)
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": []}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.side_effect = [
+                httpx.ConnectError("connection refused"),
+                mock_response_obj,
+            ]
+            mock_client.return_value = mock_client_instance
+
+            result = await handle_pia_search_content({"query": "test"})
+            assert mock_client_instance.post.call_count == 2
+            assert '"documents"' in result[0].text
+
+            search_tools._response_cache.clear()
+            mock_client_instance.post.reset_mock()
+            mock_client_instance.post.side_effect = httpx.ConnectError("down")
+
+            result = await handle_pia_search_content({"query": "test"})
+            assert mock_client_instance.post.call_count == 2
+            assert result[0].text == "Error: down"
+
+
+@pytest.mark.asyncio
+async def test_compact_responses(monkeypatch):
+    """Test that COMPACT_RESPONSES returns results without indentation."""
+    from pia_mcp_server.tools import search_tools
+
+    monkeypatch.setattr(search_tools.settings, "COMPACT_RESPONSES", True)
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": [1, 2]}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            result = await handle_pia_search_content({"query": "test"})
+
+            assert result[0].text == '{"documents":[1,2]}'
+
+
+@pytest.mark.asyncio
+async def test_next_page_is_prefetched(monkeypatch):
+    """Test that PREFETCH_NEXT_PAGE warms the cache with the following page."""
+    from pia_mcp_server.tools import search_tools
+
+    monkeypatch.setattr(search_tools.settings, "PREFETCH_NEXT_PAGE", True)
+    mock_response = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {"documents": [{"id": str(i)} for i in range(10)]},
+    }
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            await handle_pia_search_content({"query": "test"})
+            await asyncio.gather(*search_tools._prefetches)
+            assert mock_client_instance.post.call_count == 2
+            request_data = json.loads(mock_client_instance.post.call_args[1]["content"])
+            assert request_data["params"]["arguments"]["page"] == 2
+
+            mock_client_instance.post.reset_mock()
+            await handle_pia_search_content({"query": "test", "page": 2})
+            await asyncio.gather(*search_tools._prefetches)
+            request_data = json.loads(mock_client_instance.post.call_args[1]["content"])
+            assert mock_client_instance.post.call_count == 1
+            assert request_data["params"]["arguments"]["page"] == 3
+
+
+@pytest.mark.asyncio
+async def test_no_prefetch_past_last_page(monkeypatch):
+    """Test that a page reaching output.total_count is not followed."""
+    from pia_mcp_server.tools import search_tools
+
+    monkeypatch.setattr(search_tools.settings, "PREFETCH_NEXT_PAGE", True)
+    mock_response = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {"structuredContent": {"output": {"total_count": 15}}},
+    }
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            await handle_pia_search_content({"query": "test", "page": 2})
+            await asyncio.gather(*search_tools._prefetches)
+
+            mock_client_instance.post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_no_prefetch_after_short_page(monkeypatch):
+    """Test that a page with fewer than page_size results is not followed."""
+    from pia_mcp_server.tools import search_tools
+
+    monkeypatch.setattr(search_tools.settings, "PREFETCH_NEXT_PAGE", True)
+    mock_response = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {"documents": [{"id": "a"}, {"id": "b"}]},
+    }
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            await handle_pia_search_titles({"query": "test", "page_size": 5})
+            await asyncio.gather(*search_tools._prefetches)
+
+            mock_client_instance.post.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_prefetch_reads_next_page_from_disk(tmp_path, monkeypatch):
+    """Test that a next page kept in the persistent cache is not re-fetched."""
+    from pia_mcp_server.tools import search_tools
+    from pia_mcp_server.tools.cache import PersistentCache
+
+    persistent = PersistentCache(str(tmp_path / "cache.db"))
+    monkeypatch.setattr(search_tools, "_persistent_cache", persistent)
+    monkeypatch.setattr(search_tools.settings, "PREFETCH_NEXT_PAGE", True)
+    next_key = search_tools._request_key(
+        "pia_search_content", {"query": "test", "page": 2}
+    )
+    persistent.set(search_tools._stored_key(next_key), "page two", ttl=60)
+    mock_response = {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "result": {"documents": [{"id": str(i)} for i in range(10)]},
+    }
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            await handle_pia_search_content({"query": "test"})
+            await asyncio.gather(*search_tools._prefetches)
+
+            mock_client_instance.post.assert_called_once()
+            assert search_tools._response_cache.get(next_key) == "page two"
+    persistent.close()
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_keeps_result_formats_apart(tmp_path, monkeypatch):
+    """Test that toggling COMPACT_RESPONSES doesn't serve the old format."""
+    from pia_mcp_server.tools import search_tools
+    from pia_mcp_server.tools.cache import PersistentCache
+
+    persistent = PersistentCache(str(tmp_path / "cache.db"))
+    monkeypatch.setattr(search_tools, "_persistent_cache", persistent)
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": [1]}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            await handle_pia_search_content({"query": "test"})
+            search_tools._response_cache.clear()
+            monkeypatch.setattr(search_tools.settings, "COMPACT_RESPONSES", True)
+            result = await handle_pia_search_content({"query": "test"})
+
+            assert mock_client_instance.post.call_count == 2
+            assert result[0].text == '{"documents":[1]}'
+    persistent.close()
+
+
+@pytest.mark.asyncio
+async def test_persistent_cache_keeps_api_urls_apart(tmp_path, monkeypatch):
+    """Test that changing PIA_API_URL doesn't serve the old server's results."""
+    from pia_mcp_server.tools import search_tools
+    from pia_mcp_server.tools.cache import PersistentCache
+
+    persistent = PersistentCache(str(tmp_path / "cache.db"))
+    monkeypatch.setattr(search_tools, "_persistent_cache", persistent)
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"documents": [1]}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            await handle_pia_search_content({"query": "test"})
+            search_tools._response_cache.clear()
+            monkeypatch.setattr(
+                search_tools.settings, "PIA_API_URL", "https://staging.example.org/"
+            )
+            await handle_pia_search_content({"query": "test"})
+
+            assert mock_client_instance.post.call_count == 2
+            assert mock_client_instance.post.call_args[0][0] == (
+                "https://staging.example.org/"
+            )
+    persistent.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_facets_on_disk_are_served_while_refreshing(tmp_path, monkeypatch):
+    """Test that expired facets on disk get the stale grace period too."""
+    from pia_mcp_server.tools import search_tools
+    from pia_mcp_server.tools.cache import PersistentCache
+
+    persistent = PersistentCache(str(tmp_path / "cache.db"))
+    monkeypatch.setattr(search_tools, "_persistent_cache", persistent)
+    key = search_tools._request_key("pia_search_content_facets", {"query": "test"})
+    with patch("pia_mcp_server.tools.cache.time.time", return_value=100.0):
+        persistent.set(search_tools._stored_key(key), "old facets", 10, 600)
+    mock_response = {"jsonrpc": "2.0", "id": 1, "result": {"facets": {}}}
+
+    with patch.object(Settings, "_get_api_key_from_args", return_value="test_key"):
+        with patch("httpx.AsyncClient") as mock_client:
+            mock_response_obj = Mock()
+            mock_response_obj.content = json.dumps(mock_response).encode()
+            mock_response_obj.raise_for_status.return_value = None
+
+            mock_client_instance = AsyncMock()
+            mock_client_instance.is_closed = False
+            mock_client_instance.post.return_value = mock_response_obj
+            mock_client.return_value = mock_client_instance
+
+            with patch("pia_mcp_server.tools.cache.time.time", return_value=200.0):
+                result = await handle_pia_search_content_facets({"query": "test"})
+                assert result[0].text == "old facets"
+                await asyncio.gather(*search_tools._inflight.values())
+
+            mock_client_instance.post.assert_called_once()
+            assert '"facets"' in search_tools._response_cache.get(key)
+    persistent.close()
+
+
+def test_request_body_is_json_rpc_tool_call():
+    """Test that the pre-encoded envelope produces a valid JSON-RPC request."""
+    from pia_mcp_server.tools import search_tools
+
+    body = search_tools._request_body("fetch", {"id": "doc-1"})
+
+    assert json.loads(body) == {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "tools/call",
+        "params": {"name": "fetch", "arguments": {"id": "doc-1"}},
+    }
+
+
+def test_tool_definitions_are_valid():
+    """Test that the unvalidated tool definitions still pass validation."""
+    import mcp.types as types
+    from pia_mcp_server.tools import search_tools
+
+    tools = [
+        value
+        for name, value in vars(search_tools).items()
+        if name.endswith("_tool") and isinstance(value, types.Tool)
+    ]
+
+    assert len(tools) == 13
+    for tool in tools:
+        validated = types.Tool.model_validate(tool.model_dump())
+        assert validated.model_dump() == tool.model_dump()
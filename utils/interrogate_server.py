@@ -27,9 +27,6 @@ import argparse
 from pathlib import Path
 from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
 
 async def list_remote_tools(api_key: str):
     """List all available tools from the remote MCP server."""
@@ -143,6 +140,9 @@ async def main():
     output_dir = Path(args.output_dir)
     output_dir.mkdir(exist_ok=True)
 
+    # Load environment variables from .env file
+    load_dotenv()
+
     # Get API key from environment
     api_key = os.getenv("PIA_API_KEY")
     if not api_key: